@@ -8,6 +8,7 @@ Run this script after applying migrations to populate the evidence table with te
 import os
 import logging
 import psycopg2
+from psycopg2.extras import execute_values
 from datetime import datetime, timedelta
 import random
 
@@ -115,8 +116,8 @@ def add_sample_evidence():
         # Get current timestamp for upload dates
         now = datetime.now().strftime('%Y-%m-%d')
         
-        # Add sample evidence for each control
-        sample_count = 0
+        # Build a sample evidence record for a random control
+        rows = []
         for i, evidence in enumerate(SAMPLE_EVIDENCE):
             # Select a random control ID
             control_id = random.choice(control_ids)
@@ -124,15 +125,7 @@ def add_sample_evidence():
             # Generate a filepath
             filepath = f"/uploads/{control_id}/{now.replace('-', '')}_{evidence['title'].replace(' ', '_')}.{evidence['filetype'].split('/')[-1]}"
             
-            # Insert the evidence record
-            cursor.execute("""
-                INSERT INTO evidence (
-                    controlid, title, description, filepath, filetype, filesize,
-                    uploadedby, uploaddate, expirationdate, status
-                ) VALUES (
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                )
-            """, (
+            rows.append((
                 control_id,
                 evidence['title'],
                 evidence['description'],
@@ -144,7 +137,15 @@ def add_sample_evidence():
                 evidence['expirationdate'],
                 evidence['status']
             ))
-            sample_count += 1
+        
+        # Insert all evidence records in a single multi-row INSERT
+        execute_values(cursor, """
+            INSERT INTO evidence (
+                controlid, title, description, filepath, filetype, filesize,
+                uploadedby, uploaddate, expirationdate, status
+            ) VALUES %s
+        """, rows)
+        sample_count = len(rows)
         
         conn.commit()
         logger.info(f"✅ Added {sample_count} sample evidence records to the database")
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime, timezone
-from app.services.database import insert, execute_query
+from app.services.database import insert, insert_many, execute_query
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +57,7 @@ class AuditLog:
         Returns:
             list: A list of AuditLog objects
         """
-        query = """
+        query = f"""
             SELECT * FROM auditlogs 
             WHERE objecttype = %s AND objectid = %s 
             ORDER BY timestamp DESC
@@ -94,7 +94,7 @@ class AuditLog:
         Returns:
             list: A list of AuditLog objects
         """
-        query = """
+        query = f"""
             SELECT * FROM auditlogs 
             WHERE username = %s 
             ORDER BY timestamp DESC
@@ -160,7 +160,7 @@ class AuditLog:
         Returns:
             AuditLog: The created AuditLog object or None if creation failed
         """
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = datetime.now(timezone.utc)
         
         try:
             log_data = insert('auditlogs', {
@@ -185,6 +185,29 @@ class AuditLog:
             logger.error(f"Error adding audit log entry: {e}")
             return None
 
+    @classmethod
+    def add_entries(cls, entries):
+        """
+        Add many audit log entries with multi-row inserts.
+
+        Args:
+            entries: Iterable of (username, action, object_type, object_id, details) tuples
+
+        Returns:
+            int: The number of entries added, or 0 if adding them failed
+        """
+        timestamp = datetime.now(timezone.utc)
+
+        try:
+            return insert_many(
+                'auditlogs',
+                ['timestamp', 'username', 'action', 'objecttype', 'objectid', 'details'],
+                ((timestamp,) + tuple(entry) for entry in entries)
+            )
+        except Exception as e:
+            logger.error(f"Error adding audit log entries: {e}")
+            return 0
+
     def to_dict(self):
         """
         Convert the audit log entry to a dictionary.
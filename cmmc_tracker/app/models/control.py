@@ -1,14 +1,19 @@
 """Control model for the CMMC Tracker application."""
 
 import logging
-from app.services.database import get_by_id, insert, update, delete, execute_query
-from app.utils.date import parse_date, format_date
+from app.services.database import get_by_id, insert, update, delete, execute_query, upsert_many
+from app.services.search import search_controls, count_controls
+from app.utils.date import parse_date
 
 logger = logging.getLogger(__name__)
 
 class Control:
     """Control model class."""
 
+    # Column order used by bulk operations such as upsert_many
+    COLUMNS = ['controlid', 'controlname', 'controldescription', 'nist_sp_800_171_mapping',
+               'policyreviewfrequency', 'lastreviewdate', 'nextreviewdate']
+
     def __init__(self, control_id, control_name, control_description=None, nist_mapping=None,
                  review_frequency=None, last_review_date=None, next_review_date=None):
         self.control_id = control_id
@@ -87,7 +92,7 @@ class Control:
     @classmethod
     def search(cls, search_term, limit=None, offset=None):
         """
-        Search for controls.
+        Search for controls, most relevant first.
 
         Args:
             search_term: The search term
@@ -97,21 +102,7 @@ class Control:
         Returns:
             list: A list of matching Control objects
         """
-        query = """
-            SELECT * FROM controls
-            WHERE controlid LIKE %s OR controlname LIKE %s OR controldescription LIKE %s
-            ORDER BY controlid
-            {"LIMIT %s" if limit else ""}
-            {"OFFSET %s" if offset else ""}
-        """
-
-        params = [f"%{search_term}%", f"%{search_term}%", f"%{search_term}%"]
-        if limit:
-            params.append(limit)
-        if offset:
-            params.append(offset)
-
-        control_data_list = execute_query(query, params, fetch_all=True)
+        control_data_list, _ = search_controls(search_term, limit=limit, offset=offset or 0)
 
         return [
             cls(
@@ -137,16 +128,10 @@ class Control:
             int: The number of controls
         """
         if search_term:
-            query = """
-                SELECT COUNT(*) FROM controls
-                WHERE controlid LIKE %s OR controlname LIKE %s OR controldescription LIKE %s
-            """
-            params = [f"%{search_term}%", f"%{search_term}%", f"%{search_term}%"]
-            result = execute_query(query, params, fetch_one=True)
-        else:
-            query = "SELECT COUNT(*) FROM controls"
-            result = execute_query(query, fetch_one=True)
+            return count_controls(search_term)
 
+        query = "SELECT COUNT(*) FROM controls"
+        result = execute_query(query, fetch_one=True)
         return result[0]
 
     @classmethod
@@ -186,6 +171,79 @@ class Control:
             logger.error(f"Error creating control: {e}")
             return None
 
+    @classmethod
+    def get_by_ids(cls, control_ids):
+        """
+        Get several controls in a single query.
+
+        Args:
+            control_ids: The control IDs to look up
+
+        Returns:
+            dict: Control objects keyed by control ID; missing IDs are omitted
+        """
+        control_ids = list(control_ids)
+        if not control_ids:
+            return {}
+
+        query = "SELECT * FROM controls WHERE controlid = ANY(%s)"
+        control_data_list = execute_query(query, (control_ids,), fetch_all=True)
+
+        return {
+            data['controlid']: cls(
+                data['controlid'],
+                data['controlname'],
+                data['controldescription'],
+                data['nist_sp_800_171_mapping'],
+                data['policyreviewfrequency'],
+                data['lastreviewdate'],
+                data['nextreviewdate']
+            ) for data in control_data_list
+        }
+
+    @classmethod
+    def upsert_many(cls, rows, page_size=None):
+        """
+        Insert new controls and update existing ones in bulk.
+
+        Rows whose values match what is already stored are left untouched.
+
+        Args:
+            rows: Iterable of value tuples in Control.COLUMNS order
+            page_size: Number of rows per INSERT statement
+
+        Returns:
+            list: (control_id, inserted) pairs for every control that was
+            inserted or changed
+        """
+        results = upsert_many(
+            'controls',
+            cls.COLUMNS,
+            rows,
+            conflict_columns=['controlid'],
+            page_size=page_size,
+            returning='controlid, (xmax = 0) AS inserted',
+            only_changed=True
+        )
+        return [(result['controlid'], result['inserted']) for result in results]
+
+    def values(self):
+        """
+        Get the control's column values in Control.COLUMNS order.
+
+        Returns:
+            tuple: The values, as used by bulk operations
+        """
+        return (
+            self.control_id,
+            self.control_name,
+            self.control_description,
+            self.nist_mapping,
+            self.review_frequency,
+            self.last_review_date,
+            self.next_review_date
+        )
+
     def update(self):
         """
         Update the control in the database.
@@ -263,9 +321,9 @@ class Control:
         Returns:
             bool: True if successful, False otherwise
         """
-        # Format dates consistently
-        self.last_review_date = format_date(parse_date(last_review_date)) if last_review_date else None
-        self.next_review_date = format_date(parse_date(next_review_date)) if next_review_date else None
+        # Store dates as native date objects
+        self.last_review_date = parse_date(last_review_date) if last_review_date else None
+        self.next_review_date = parse_date(next_review_date) if next_review_date else None
 
         try:
             update('controls', 'controlid', self.control_id, {
@@ -345,10 +403,11 @@ class Control:
             return None
 
         try:
-            from datetime import date, timedelta
             from dateutil.relativedelta import relativedelta
 
-            last_review = date.fromisoformat(self.last_review_date)
+            last_review = parse_date(self.last_review_date)
+            if not last_review:
+                return None
             next_review = last_review + relativedelta(months=months)
 
             return next_review.isoformat()
@@ -366,16 +425,14 @@ class Control:
         if not self.next_review_date:
             return False
 
-        try:
-            from datetime import date
-            next_review = date.fromisoformat(self.next_review_date)
-            today = date.today()
-
-            return next_review <= today
-        except ValueError as e:
-            logger.error(f"Error checking if review is due: {e}")
+        from datetime import date
+        next_review = parse_date(self.next_review_date)
+        if not next_review:
+            logger.error(f"Error checking if review is due: invalid date {self.next_review_date}")
             return False
 
+        return next_review <= date.today()
+
     def to_dict(self):
         """
         Convert the control to a dictionary.
@@ -1,7 +1,7 @@
 """Task model for the CMMC Tracker application."""
 
 import logging
-from datetime import date
+from datetime import date, timedelta
 from app.services.database import get_by_id, insert, update, delete, execute_query
 from app.utils.date import parse_date, format_date
 
@@ -169,7 +169,7 @@ class Task:
         Returns:
             list: A list of overdue Task objects
         """
-        today = date.today().isoformat()
+        today = date.today()
         query = "SELECT * FROM tasks WHERE duedate < %s AND status != 'Completed' ORDER BY duedate"
         task_data_list = execute_query(query, (today,), fetch_all=True)
         
@@ -198,14 +198,14 @@ class Task:
             list: A list of Task objects due soon
         """
         today = date.today()
-        end_date = today + date.timedelta(days=days)
+        end_date = today + timedelta(days=days)
         
         query = """
             SELECT * FROM tasks 
             WHERE duedate >= %s AND duedate <= %s AND status != 'Completed'
             ORDER BY duedate
         """
-        task_data_list = execute_query(query, (today.isoformat(), end_date.isoformat()), fetch_all=True)
+        task_data_list = execute_query(query, (today, end_date), fetch_all=True)
         
         return [
             cls(
@@ -235,8 +235,8 @@ class Task:
         Returns:
             Task: The created Task object or None if creation failed
         """
-        # Format due date consistently
-        formatted_due_date = format_date(parse_date(due_date)) if due_date else None
+        # Store the due date as a native date
+        formatted_due_date = parse_date(due_date) if due_date else None
         
         try:
             task_data = insert('tasks', {
@@ -275,7 +275,7 @@ class Task:
                 'controlid': self.control_id,
                 'taskdescription': self.task_description,
                 'assignedto': self.assigned_to,
-                'duedate': self.due_date,
+                'duedate': format_date(self.due_date) or None,
                 'status': self.status,
                 'confirmed': self.confirmed,
                 'reviewer': self.reviewer
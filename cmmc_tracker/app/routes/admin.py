@@ -7,12 +7,12 @@ from flask_login import login_required, current_user
 from app.models.task import Task
 from app.models.user import User
 from app.services.database import execute_query
-from app.utils.date import parse_date, format_date
 from werkzeug.security import generate_password_hash
 from app.services.email import check_and_notify_task_deadlines
 from app.services.auth import admin_required
 from app.services.audit import add_audit_log, get_recent_audit_logs
 from app.services.settings import get_all_settings, update_setting
+from app.services.export import csv_response, iter_audit_log_rows, AUDIT_LOG_EXPORT_HEADER
 from app.utils.security import is_password_strong
 from app import limiter
 
@@ -93,29 +93,27 @@ def reports():
 
         # Past Due Controls
         past_due_controls_query = """
-            SELECT * FROM controls
-            WHERE nextreviewdate IS NOT NULL AND nextreviewdate != ''
-            AND nextreviewdate < %s
+            SELECT controlid, controlname, nextreviewdate,
+                   %s::date - nextreviewdate AS days_overdue
+            FROM controls
+            WHERE nextreviewdate < %s
             ORDER BY nextreviewdate
         """
         past_due_controls_db = execute_query(
             past_due_controls_query,
-            (today.isoformat(),),
+            (today, today),
             fetch_all=True
         )
 
-        # Convert to dictionaries and add days overdue
-        past_due_controls = []
-        for control in past_due_controls_db:
-            next_review = parse_date(control['nextreviewdate'])
-            days_overdue = (today - next_review).days if next_review else None
-
-            past_due_controls.append({
+        past_due_controls = [
+            {
                 'id': control['controlid'],
                 'name': control['controlname'],
-                'next_review': format_date(control['nextreviewdate']),
-                'days_overdue': days_overdue
-            })
+                'next_review': control['nextreviewdate'],
+                'days_overdue': control['days_overdue']
+            }
+            for control in past_due_controls_db
+        ]
 
         return render_template(
             'admin_dashboard.html',
@@ -130,6 +128,13 @@ def reports():
         flash('An error occurred while generating the dashboard.', 'danger')
         return redirect(url_for('controls.dashboard'))
 
+@admin_bp.route('/audit_logs/export_csv')
+@login_required
+@admin_required
+def export_audit_logs():
+    """Export the full audit log to CSV, streamed from a server-side cursor."""
+    return csv_response('cmmc_audit_log_export', AUDIT_LOG_EXPORT_HEADER, iter_audit_log_rows())
+
 @admin_bp.route('/users')
 @login_required
 def users():
@@ -10,10 +10,11 @@ from app.models.task import Task
 from app.models.user import User
 from app.services.audit import add_audit_log, get_audit_logs_for_object
 from app.utils.date import is_date_valid, format_date, parse_date, is_past_date
-from app.services.database import execute_query
+from app.services.database import execute_query, transaction
+from app.services.control_import import import_controls_csv, ControlImportError
+from app.services.export import csv_response, iter_control_rows, CONTROL_EXPORT_HEADER
+from app.services.search import search_controls
 from app.services.auth import admin_required
-import csv
-import io
 
 logger = logging.getLogger(__name__)
 
@@ -80,13 +81,12 @@ def dashboard():
             non_compliant = 0
 
         # Get upcoming reviews (next 30 days)
-        thirty_days_later = (today + timedelta(days=30)).isoformat()
+        thirty_days_later = today + timedelta(days=30)
         upcoming_reviews_query = """
             SELECT COUNT(*) FROM controls
-            WHERE nextreviewdate IS NOT NULL AND nextreviewdate != ''
-            AND nextreviewdate BETWEEN %s AND %s
+            WHERE nextreviewdate BETWEEN %s AND %s
         """
-        upcoming_reviews = execute_query(upcoming_reviews_query, (today.isoformat(), thirty_days_later),
+        upcoming_reviews = execute_query(upcoming_reviews_query, (today, thirty_days_later),
                                         query_name="upcoming_reviews", fetch_one=True)[0]
 
         # --- Consolidated Task Status Query ---
@@ -96,10 +96,10 @@ def dashboard():
             SUM(CASE WHEN status = 'Open' THEN 1 ELSE 0 END) as open_tasks,
             SUM(CASE WHEN status = 'Pending Confirmation' THEN 1 ELSE 0 END) as in_progress_tasks,
             SUM(CASE WHEN status = 'Completed' THEN 1 ELSE 0 END) as completed_tasks,
-            SUM(CASE WHEN status != 'Completed' AND duedate IS NOT NULL AND duedate != '' AND duedate < %s THEN 1 ELSE 0 END) as overdue_tasks
+            SUM(CASE WHEN status != 'Completed' AND duedate < %s THEN 1 ELSE 0 END) as overdue_tasks
         FROM tasks;
         """
-        task_status_results = execute_query(task_status_query, (today.isoformat(),),
+        task_status_results = execute_query(task_status_query, (today,),
                                           query_name="task_status", fetch_one=True)
         open_tasks = task_status_results['open_tasks'] if task_status_results else 0
         in_progress_tasks = task_status_results['in_progress_tasks'] if task_status_results else 0
@@ -129,7 +129,7 @@ def dashboard():
             ORDER BY t.duedate ASC NULLS LAST
             LIMIT 10
         """
-        my_tasks = execute_query(my_tasks_query, (today.isoformat(), current_user.username),
+        my_tasks = execute_query(my_tasks_query, (today, current_user.username),
                                query_name="my_tasks", fetch_all=True)
 
         # New: Get domain metrics
@@ -259,10 +259,11 @@ def generate_domain_metrics():
 def dashboard_profile():
     """Display profiling data for the dashboard."""
     try:
-        from app.utils.profiler import get_profiling_data
+        from app.utils.profiler import get_profiling_data, get_counters
 
         # Get profiling data
         profiling_data = get_profiling_data()
+        counters = sorted(get_counters().items())
 
         # Format data for display
         formatted_data = []
@@ -286,7 +287,8 @@ def dashboard_profile():
 
         return render_template(
             'dashboard_profile.html',
-            profiling_data=formatted_data
+            profiling_data=formatted_data,
+            counters=counters
         )
     except Exception as e:
         logger.error(f"Error generating dashboard profile: {e}")
@@ -324,8 +326,14 @@ def index():
     page = request.args.get('page', 1, type=int)
     search_term = request.args.get('q', '')
 
+    # Search results are ranked by relevance unless a column sort is chosen
+    if search_term and 'sort_by' not in request.args:
+        sort_by = 'relevance'
+
     # Validate sort parameters
     valid_sort_columns = ['controlid', 'controlname', 'nextreviewdate']
+    if search_term:
+        valid_sort_columns.append('relevance')
     if sort_by not in valid_sort_columns:
         sort_by = 'controlid'
 
@@ -338,27 +346,14 @@ def index():
 
     # Get controls
     if search_term:
-        # Search for controls
-        controls_data = execute_query(
-            """
-            SELECT * FROM controls
-            WHERE controlid LIKE %s OR controlname LIKE %s OR controldescription LIKE %s
-            ORDER BY {} {}
-            LIMIT %s OFFSET %s
-            """.format(sort_by, sort_order.upper()),
-            (f'%{search_term}%', f'%{search_term}%', f'%{search_term}%', items_per_page, offset),
-            fetch_all=True
+        # Ranked search; the total count comes back with the page
+        controls_data, total_count = search_controls(
+            search_term,
+            limit=items_per_page,
+            offset=offset,
+            sort_by=sort_by,
+            sort_order=sort_order
         )
-
-        # Get total count for pagination
-        total_count = execute_query(
-            """
-            SELECT COUNT(*) FROM controls
-            WHERE controlid LIKE %s OR controlname LIKE %s OR controldescription LIKE %s
-            """,
-            (f'%{search_term}%', f'%{search_term}%', f'%{search_term}%'),
-            fetch_one=True
-        )[0]
     else:
         # Get all controls
         controls_data = execute_query(
@@ -474,18 +469,21 @@ def create_control():
             flash('Control ID already exists. Please choose a different ID.', 'danger')
             return render_template('create_control.html')
 
-        # Create the control
-        control = Control.create(
-            control_id,
-            control_name,
-            control_description,
-            nist_mapping,
-            review_frequency
-        )
+        # Create the control and its audit entry in one transaction
+        with transaction() as tx:
+            control = Control.create(
+                control_id,
+                control_name,
+                control_description,
+                nist_mapping,
+                review_frequency
+            )
 
-        if control:
-            # Log the action
-            add_audit_log(current_user.username, 'Create Control', 'Control', control_id)
+            if control:
+                # Log the action
+                add_audit_log(current_user.username, 'Create Control', 'Control', control_id)
+
+        if control and tx.committed:
             flash('Control created successfully!', 'success')
             return redirect(url_for('controls.index'))
         else:
@@ -509,9 +507,13 @@ def edit_control(control_id):
         control.nist_mapping = request.form['nist_mapping']
         control.review_frequency = request.form['review_frequency']
 
-        if control.update():
-            # Log the action
-            add_audit_log(current_user.username, 'Edit Control', 'Control', control_id)
+        with transaction() as tx:
+            updated = control.update()
+            if updated:
+                # Log the action
+                add_audit_log(current_user.username, 'Edit Control', 'Control', control_id)
+
+        if updated and tx.committed:
             flash('Control updated successfully!', 'success')
             return redirect(url_for('controls.control_detail', control_id=control_id))
         else:
@@ -542,9 +544,13 @@ def delete_control(control_id):
         return redirect(url_for('controls.control_detail', control_id=control_id))
 
     # Delete the control
-    if control.delete():
-        # Log the action
-        add_audit_log(current_user.username, 'Delete Control', 'Control', control_id)
+    with transaction() as tx:
+        deleted = control.delete()
+        if deleted:
+            # Log the action
+            add_audit_log(current_user.username, 'Delete Control', 'Control', control_id)
+
+    if deleted and tx.committed:
         flash('Control deleted successfully!', 'success')
         return redirect(url_for('controls.index'))
     else:
@@ -578,9 +584,13 @@ def update_review_dates(control_id):
         flash('Warning: Next review date is in the past.', 'warning')
 
     # Update review dates
-    if control.update_review_dates(last_review_date_str, next_review_date_str):
-        # Log the action
-        add_audit_log(current_user.username, 'Update Review Dates', 'Control', control_id)
+    with transaction() as tx:
+        updated = control.update_review_dates(last_review_date_str, next_review_date_str)
+        if updated:
+            # Log the action
+            add_audit_log(current_user.username, 'Update Review Dates', 'Control', control_id)
+
+    if updated and tx.committed:
         flash('Review dates updated successfully!', 'success')
     else:
         flash('An error occurred while updating review dates.', 'danger')
@@ -590,43 +600,15 @@ def update_review_dates(control_id):
 @controls_bp.route('/export_csv')
 @login_required
 def export_csv():
-    """Export controls to CSV."""
+    """Export controls to CSV, streamed from a server-side cursor."""
     try:
-        # Get all controls
-        controls = Control.get_all()
+        has_controls = execute_query("SELECT EXISTS (SELECT 1 FROM controls)", fetch_one=True)[0]
 
-        if not controls:
+        if not has_controls:
             flash('No controls to export', 'error')
             return redirect(url_for('controls.index'))
 
-        # Create a CSV string
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(['Control ID', 'Control Name', 'Control Description', 'NIST Mapping',
-                         'Review Frequency', 'Last Review Date', 'Next Review Date'])
-
-        # Write data
-        for control in controls:
-            writer.writerow([
-                control.control_id,
-                control.control_name,
-                control.control_description,
-                control.nist_mapping,
-                control.review_frequency,
-                format_date(control.last_review_date) if control.last_review_date else '',
-                format_date(control.next_review_date) if control.next_review_date else ''
-            ])
-
-        # Create the response
-        response = Response(
-            output.getvalue(),
-            mimetype='text/csv',
-            headers={'Content-Disposition': f'attachment;filename=cmmc_controls_export_{datetime.now().strftime("%Y%m%d")}.csv'}
-        )
-
-        return response
+        return csv_response('cmmc_controls_export', CONTROL_EXPORT_HEADER, iter_control_rows())
     except Exception as e:
         logger.error(f"Error exporting controls: {e}")
         flash('Error exporting controls', 'error')
@@ -655,51 +637,24 @@ def import_csv():
             flash('File must be a CSV', 'error')
             return redirect(request.url)
 
-        # Process the CSV file
-        csv_content = file.read().decode('utf-8')
-        csv_file = io.StringIO(csv_content)
-        reader = csv.DictReader(csv_file)
-
-        imported_count = 0
-        updated_count = 0
-        error_count = 0
-
-        for row in reader:
-            try:
-                # Check if control exists
-                existing_control = Control.get_by_id(row['Control ID'])
-
-                # Format dates correctly
-                last_review_date = parse_date(row.get('Last Review Date', '')) if row.get('Last Review Date') else None
-                next_review_date = parse_date(row.get('Next Review Date', '')) if row.get('Next Review Date') else None
-
-                # Create control object
-                control = Control(
-                    control_id=row['Control ID'],
-                    control_name=row['Control Name'],
-                    control_description=row.get('Control Description', ''),
-                    nist_mapping=row.get('NIST Mapping', ''),
-                    review_frequency=row.get('Review Frequency', ''),
-                    last_review_date=last_review_date,
-                    next_review_date=next_review_date
-                )
-
-                if existing_control:
-                    # Update existing control
-                    control.save()
-                    updated_count += 1
-                else:
-                    # Insert new control
-                    control.save()
-                    imported_count += 1
-            except Exception as e:
-                logger.error(f"Error importing row {row}: {e}")
-                error_count += 1
-
-        if error_count:
-            flash(f'Imported {imported_count} new controls, updated {updated_count} existing controls with {error_count} errors', 'warning')
+        dry_run = request.form.get('dry_run') == 'on'
+
+        # Parse, validate and upsert the rows straight from the upload stream
+        try:
+            report = import_controls_csv(file.stream, current_user.username, dry_run=dry_run)
+        except ControlImportError as e:
+            flash(f'Error importing controls: {e}', 'error')
+            return redirect(request.url)
+
+        if dry_run:
+            return render_template('import_controls.html', report=report)
+
+        summary = (f"Imported {report['inserted']} new controls, updated {report['updated']} existing controls"
+                   f" ({report['unchanged']} unchanged)")
+        if report['errors']:
+            flash(f"{summary} with {report['errors']} errors", 'warning')
         else:
-            flash(f'Successfully imported {imported_count} new controls and updated {updated_count} existing controls', 'success')
+            flash(f"Successfully {summary[0].lower()}{summary[1:]}", 'success')
 
         return redirect(url_for('controls.index'))
     except Exception as e:
@@ -11,6 +11,8 @@ from app.services.settings import get_setting # Import get_setting
 from app.models.evidence import Evidence
 from app.models.control import Control
 from app.services.audit import add_audit_log
+from app.services.database import transaction
+from app.services.export import csv_response, iter_evidence_rows, EVIDENCE_EXPORT_HEADER
 from app.services.storage import save_evidence_file, get_evidence_file_path, delete_evidence_file
 from app.utils.date import is_date_valid, format_date
 from app import limiter
@@ -256,27 +258,29 @@ def add_evidence(control_id):
             # --- End Expiration Date Calculation ---
 
             # Create evidence record using the final calculated/provided expiration date
-            evidence = Evidence.create(
-                control_id,
-                title,
-                description,
-                file_path,
-                saved_file_type,
-                file_size,
-                current_user.username,
-                final_expiration_date_str # Use the processed date string
-            )
-
-            if evidence:
-                # Log the action
-                add_audit_log(
+            with transaction() as tx:
+                evidence = Evidence.create(
+                    control_id,
+                    title,
+                    description,
+                    file_path,
+                    saved_file_type,
+                    file_size,
                     current_user.username,
-                    'Create Evidence',
-                    'Evidence',
-                    evidence.evidence_id,
-                    f"Added evidence '{title}' for control {control_id}"
+                    final_expiration_date_str # Use the processed date string
                 )
 
+                if evidence:
+                    # Log the action
+                    add_audit_log(
+                        current_user.username,
+                        'Create Evidence',
+                        'Evidence',
+                        evidence.evidence_id,
+                        f"Added evidence '{title}' for control {control_id}"
+                    )
+
+            if evidence and tx.committed:
                 flash('Evidence added successfully!', 'success')
                 return redirect(url_for('evidence.list_evidence', control_id=control_id))
             else:
@@ -289,6 +293,13 @@ def add_evidence(control_id):
         flash('An error occurred while adding evidence.', 'danger')
         return redirect(url_for('evidence.list_evidence', control_id=control_id))
 
+@evidence_bp.route('/evidence/export_csv')
+@login_required
+def export_csv():
+    """Export evidence metadata to CSV, optionally for a single control."""
+    control_id = request.args.get('control_id') or None
+    return csv_response('cmmc_evidence_export', EVIDENCE_EXPORT_HEADER, iter_evidence_rows(control_id))
+
 @evidence_bp.route('/evidence/<evidence_id>/download')
 @login_required
 @limiter.limit("30 per hour")
@@ -350,16 +361,19 @@ def delete_evidence(evidence_id):
             delete_evidence_file(evidence.file_path)
 
         # Delete the database record
-        if evidence.delete():
-            # Log the action
-            add_audit_log(
-                current_user.username,
-                'Delete Evidence',
-                'Evidence',
-                evidence_id,
-                f"Deleted evidence '{title}' for control {control_id}"
-            )
+        with transaction() as tx:
+            deleted = evidence.delete()
+            if deleted:
+                # Log the action
+                add_audit_log(
+                    current_user.username,
+                    'Delete Evidence',
+                    'Evidence',
+                    evidence_id,
+                    f"Deleted evidence '{title}' for control {control_id}"
+                )
 
+        if deleted and tx.committed:
             flash('Evidence deleted successfully!', 'success')
         else:
             flash('Failed to delete evidence record.', 'danger')
@@ -407,16 +421,19 @@ def update_evidence(evidence_id):
             evidence.expiration_date = format_date(expiration_date) if expiration_date else None
             evidence.status = status
 
-            if evidence.update():
-                # Log the action
-                add_audit_log(
-                    current_user.username,
-                    'Update Evidence',
-                    'Evidence',
-                    evidence_id,
-                    f"Updated evidence '{title}' for control {control_id}"
-                )
-
+            with transaction() as tx:
+                updated = evidence.update()
+                if updated:
+                    # Log the action
+                    add_audit_log(
+                        current_user.username,
+                        'Update Evidence',
+                        'Evidence',
+                        evidence_id,
+                        f"Updated evidence '{title}' for control {control_id}"
+                    )
+
+            if updated and tx.committed:
                 flash('Evidence updated successfully!', 'success')
                 return redirect(url_for('evidence.list_evidence', control_id=control_id))
             else:
@@ -6,7 +6,6 @@ from flask import Blueprint, render_template, request, flash, redirect, url_for
 from flask_login import login_required, current_user
 from app.models.task import Task
 from app.services.database import execute_query
-from app.utils.date import parse_date, format_date
 
 logger = logging.getLogger(__name__)
 
@@ -82,55 +81,29 @@ def reports():
         
         # Upcoming Controls
         upcoming_controls_query = """
-            SELECT * FROM controls
-            WHERE nextreviewdate IS NOT NULL AND nextreviewdate != ''
-            AND nextreviewdate > %s AND nextreviewdate <= %s
+            SELECT *, nextreviewdate - %s::date AS days_until FROM controls
+            WHERE nextreviewdate > %s AND nextreviewdate <= %s
             ORDER BY nextreviewdate
         """
         upcoming_controls_db = execute_query(
             upcoming_controls_query,
-            (today.isoformat(), future_date.isoformat()),
+            (today, today, future_date),
             fetch_all=True
         )
-        
-        # Convert to dictionaries and add days until
-        upcoming_controls = []
-        for control in upcoming_controls_db:
-            control_dict = dict(control)
-            
-            review_date = parse_date(control_dict['nextreviewdate'])
-            if review_date:
-                control_dict['days_until'] = (review_date - today).days
-            else:
-                control_dict['days_until'] = 'N/A'
-                
-            upcoming_controls.append(control_dict)
+        upcoming_controls = [dict(control) for control in upcoming_controls_db]
         
         # Past Due Controls
         past_due_controls_query = """
-            SELECT * FROM controls
-            WHERE nextreviewdate IS NOT NULL AND nextreviewdate != ''
-            AND nextreviewdate < %s
+            SELECT *, %s::date - nextreviewdate AS days_since FROM controls
+            WHERE nextreviewdate < %s
             ORDER BY nextreviewdate
         """
         past_due_controls_db = execute_query(
             past_due_controls_query,
-            (today.isoformat(),),
+            (today, today),
             fetch_all=True
         )
-        
-        # Convert to dictionaries and add days since
-        past_due_controls = []
-        for control in past_due_controls_db:
-            control_dict = dict(control)
-            
-            review_date = parse_date(control_dict['nextreviewdate'])
-            if review_date:
-                control_dict['days_since'] = (today - review_date).days
-            else:
-                control_dict['days_since'] = 'N/A'
-                
-            past_due_controls.append(control_dict)
+        past_due_controls = [dict(control) for control in past_due_controls_db]
         
         return render_template(
             'reports.html',
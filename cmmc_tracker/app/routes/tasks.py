@@ -7,9 +7,10 @@ from app.models.task import Task
 from app.models.control import Control
 from app.services.audit import add_audit_log
 from app.services.email import send_task_notification
-from app.utils.date import is_date_valid, format_date
-from app.services.database import execute_query
+from app.utils.date import is_date_valid, parse_date
+from app.services.database import execute_query, transaction
 from app.services.database import get_db_connection
+from app.services.export import csv_response, iter_task_rows, TASK_EXPORT_HEADER
 
 # Remove the builtins import and use the Python standard library
 import math  # For ceil function
@@ -44,20 +45,22 @@ def add_task(control_id):
                 flash('Invalid due date format. Please use YYYY-MM-DD.', 'danger')
                 return render_template('add_task.html', control_id=control_id, users=users)
             
-            # Create the task
-            task = Task.create(
-                control_id,
-                task_description,
-                assigned_to,
-                due_date_str,
-                reviewer
-            )
-            
-            if task:
-                # Log the action
-                add_audit_log(current_user.username, 'Create Task', 'Task', task.task_id)
+            # Create the task and its audit entry in one transaction
+            with transaction() as tx:
+                task = Task.create(
+                    control_id,
+                    task_description,
+                    assigned_to,
+                    due_date_str,
+                    reviewer
+                )
                 
-                # Send email notification to the assignee
+                if task:
+                    # Log the action
+                    add_audit_log(current_user.username, 'Create Task', 'Task', task.task_id)
+            
+            if task and tx.committed:
+                # Send email notification to the assignee once the task is committed
                 send_task_notification(task.task_id, 'assigned')
                 
                 flash('Task added successfully!', 'success')
@@ -108,12 +111,16 @@ def edit_task(task_id):
             flash('Invalid due date format. Please use YYYY-MM-DD.', 'danger')
             return render_template('edit_task.html', task=task.to_dict(), users=users)
         
-        # Format due date consistently
-        task.due_date = format_date(due_date_str)
+        # Store the due date as a native date
+        task.due_date = parse_date(due_date_str)
         
-        if task.update():
-            # Log the action
-            add_audit_log(current_user.username, 'Edit Task', 'Task', task_id)
+        with transaction() as tx:
+            updated = task.update()
+            if updated:
+                # Log the action
+                add_audit_log(current_user.username, 'Edit Task', 'Task', task_id)
+        
+        if updated and tx.committed:
             flash('Task updated successfully!', 'success')
             return redirect(url_for('controls.control_detail', control_id=task.control_id))
         else:
@@ -140,10 +147,13 @@ def complete_task(task_id):
         flash('This task is already completed.', 'info')
         return redirect(url_for('controls.control_detail', control_id=task.control_id))
     
-    if task.complete():
-        # Log the action
-        add_audit_log(current_user.username, 'Complete Task', 'Task', task_id)
-        
+    with transaction() as tx:
+        completed = task.complete()
+        if completed:
+            # Log the action
+            add_audit_log(current_user.username, 'Complete Task', 'Task', task_id)
+    
+    if completed and tx.committed:
         # Send email notification to the reviewer
         send_task_notification(task_id, 'completed')
         
@@ -172,10 +182,13 @@ def confirm_task(task_id):
         flash('This task is not awaiting confirmation.', 'info')
         return redirect(url_for('controls.control_detail', control_id=task.control_id))
     
-    if task.confirm():
-        # Log the action
-        add_audit_log(current_user.username, 'Confirm Task', 'Task', task_id)
-        
+    with transaction() as tx:
+        confirmed = task.confirm()
+        if confirmed:
+            # Log the action
+            add_audit_log(current_user.username, 'Confirm Task', 'Task', task_id)
+    
+    if confirmed and tx.committed:
         # Send email notification to the assignee
         send_task_notification(task_id, 'confirmed')
         
@@ -211,15 +224,25 @@ def delete_task(task_id):
     # Store control_id before deleting
     control_id = task.control_id
     
-    if task.delete():
-        # Log the action
-        add_audit_log(current_user.username, 'Delete Task', 'Task', task_id)
+    with transaction() as tx:
+        deleted = task.delete()
+        if deleted:
+            # Log the action
+            add_audit_log(current_user.username, 'Delete Task', 'Task', task_id)
+    
+    if deleted and tx.committed:
         flash('Task deleted successfully!', 'success')
     else:
         flash('An error occurred while deleting the task.', 'danger')
     
     return redirect(url_for('controls.control_detail', control_id=control_id))
 
+@tasks_bp.route('/tasks/export_csv')
+@login_required
+def export_csv():
+    """Export all tasks to CSV, streamed from a server-side cursor."""
+    return csv_response('cmmc_tasks_export', TASK_EXPORT_HEADER, iter_task_rows())
+
 @tasks_bp.route('/statistics')
 def statistics():
     """Display task statistics."""
@@ -256,18 +279,31 @@ def calendar():
         tasks_page = request.args.get('tasks_page', 1, type=int)
         items_per_page = 10
         
-        # Get controls with review dates
-        controls_count_query = "SELECT COUNT(*) FROM controls WHERE nextreviewdate IS NOT NULL AND nextreviewdate != ''"
+        from datetime import date, timedelta
+        today = date.today()
+        next_month = today + timedelta(days=30)
+        
+        # Get controls with review dates, flagged past-due or upcoming
+        controls_count_query = "SELECT COUNT(*) FROM controls WHERE nextreviewdate IS NOT NULL"
         controls_count = execute_query(controls_count_query, fetch_one=True)[0]
         
-        controls_query = '''
-            SELECT * FROM controls 
-            WHERE nextreviewdate IS NOT NULL AND nextreviewdate != '' 
-            ORDER BY nextreviewdate 
-            LIMIT %s OFFSET %s
+        controls_select = '''
+            SELECT controlid, controlname, nextreviewdate,
+                   CASE WHEN nextreviewdate < %s THEN 'past-due'
+                        WHEN nextreviewdate <= %s THEN 'upcoming'
+                        ELSE '' END AS status
+            FROM controls
+            WHERE nextreviewdate IS NOT NULL
+            ORDER BY nextreviewdate
         '''
         controls_offset = (controls_page - 1) * items_per_page
-        controls_data = execute_query(controls_query, (items_per_page, controls_offset), fetch_all=True)
+        controls_data = execute_query(controls_select + ' LIMIT %s OFFSET %s',
+                                      (today, next_month, items_per_page, controls_offset), fetch_all=True)
+        controls_with_status = [dict(control) for control in controls_data]
+        
+        # Get all controls for the calendar view (no pagination for the calendar itself)
+        all_controls_data = execute_query(controls_select, (today, next_month), fetch_all=True)
+        all_controls_with_status = [dict(control) for control in all_controls_data]
         
         # Get all tasks with pagination
         tasks_count_query = "SELECT COUNT(*) FROM tasks"
@@ -281,55 +317,6 @@ def calendar():
         tasks_offset = (tasks_page - 1) * items_per_page
         tasks_data = execute_query(tasks_query, (items_per_page, tasks_offset), fetch_all=True)
         
-        # Process controls to add status (past-due, upcoming)
-        from datetime import date, timedelta
-        today = date.today()
-        next_month = today + timedelta(days=30)
-        
-        controls_with_status = []
-        for control in controls_data:
-            if control['nextreviewdate']:
-                review_date = format_date(control['nextreviewdate'])
-                if review_date:
-                    from app.utils.date import parse_date
-                    review_date_obj = parse_date(review_date)
-                    status = ""
-                    if review_date_obj < today:
-                        status = "past-due"
-                    elif review_date_obj <= next_month:
-                        status = "upcoming"
-                    
-                    controls_with_status.append({
-                        'controlid': control['controlid'],
-                        'controlname': control['controlname'],
-                        'nextreviewdate': review_date,
-                        'status': status
-                    })
-        
-        # Get all controls for the calendar view (no pagination for the calendar itself)
-        all_controls_query = "SELECT * FROM controls WHERE nextreviewdate IS NOT NULL AND nextreviewdate != ''"
-        all_controls_data = execute_query(all_controls_query, fetch_all=True)
-        
-        all_controls_with_status = []
-        for control in all_controls_data:
-            if control['nextreviewdate']:
-                review_date = format_date(control['nextreviewdate'])
-                if review_date:
-                    from app.utils.date import parse_date
-                    review_date_obj = parse_date(review_date)
-                    status = ""
-                    if review_date_obj < today:
-                        status = "past-due"
-                    elif review_date_obj <= next_month:
-                        status = "upcoming"
-                    
-                    all_controls_with_status.append({
-                        'controlid': control['controlid'],
-                        'controlname': control['controlname'],
-                        'nextreviewdate': review_date,
-                        'status': status
-                    })
-        
         # Calculate pagination metadata
         controls_total_pages = (controls_count + items_per_page - 1) // items_per_page
         tasks_total_pages = (tasks_count + items_per_page - 1) // items_per_page
@@ -28,6 +28,20 @@ def add_audit_log(username, action, object_type, object_id=None, details=None):
         logger.error(f"Failed to add audit log: {e}")
         return False
 
+def add_audit_logs(entries):
+    """
+    Add many entries to the audit log at once.
+    
+    Args:
+        entries (iterable): (username, action, object_type, object_id, details) tuples
+        
+    Returns:
+        int: The number of entries added
+    """
+    count = AuditLog.add_entries(entries)
+    logger.info(f"Audit log added: {count} entries")
+    return count
+
 def get_audit_logs_for_object(object_type, object_id, limit=50):
     """
     Get audit logs for a specific object.
@@ -0,0 +1,176 @@
+"""Control CSV import service for the CMMC Tracker application."""
+
+import csv
+import io
+import logging
+from datetime import date
+from flask import current_app
+from app.models.control import Control
+from app.services.audit import add_audit_logs
+from app.services.database import transaction
+from app.utils.date import parse_date, format_date
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_COLUMNS = ['Control ID', 'Control Name']
+
+# Maximum number of row errors kept for display; the count is always exact
+MAX_REPORTED_ERRORS = 20
+
+class ControlImportError(Exception):
+    """Raised when an import file can't be processed at all."""
+    pass
+
+def parse_control_row(row):
+    """
+    Validate a CSV row and convert it to Control.COLUMNS values.
+
+    Args:
+        row (dict): A row from csv.DictReader
+
+    Returns:
+        tuple: The control values
+
+    Raises:
+        ValueError: If the row is invalid
+    """
+    control_id = (row.get('Control ID') or '').strip()
+    control_name = (row.get('Control Name') or '').strip()
+    if not control_id or not control_name:
+        raise ValueError('Control ID and Control Name are required')
+
+    review_dates = []
+    for column in ('Last Review Date', 'Next Review Date'):
+        value = (row.get(column) or '').strip()
+        if value and parse_date(value) is None:
+            raise ValueError(f'Invalid {column} "{value}", expected YYYY-MM-DD')
+        review_dates.append(format_date(value) if value else None)
+
+    return (
+        control_id,
+        control_name,
+        row.get('Control Description') or '',
+        row.get('NIST Mapping') or '',
+        row.get('Review Frequency') or '',
+        review_dates[0],
+        review_dates[1]
+    )
+
+def _comparable(values):
+    """Normalize stored control values so they compare equal to parsed CSV values."""
+    return tuple(format_date(value) if isinstance(value, date) else value for value in values)
+
+def _iter_batches(reader, batch_size, report):
+    """
+    Validate rows from a DictReader and group the valid ones into batches.
+
+    Invalid and duplicate rows are recorded in the report and skipped.
+    """
+    seen_ids = set()
+    batch = []
+    for row in reader:
+        line = reader.line_num
+        try:
+            values = parse_control_row(row)
+            if values[0] in seen_ids:
+                raise ValueError(f'Duplicate Control ID "{values[0]}"')
+            seen_ids.add(values[0])
+            batch.append(values)
+        except ValueError as e:
+            report['errors'] += 1
+            if len(report['error_messages']) < MAX_REPORTED_ERRORS:
+                report['error_messages'].append(f'Line {line}: {e}')
+
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+def import_controls_csv(stream, username, dry_run=False, batch_size=None):
+    """
+    Import controls from a CSV upload.
+
+    The file is parsed incrementally from the upload stream and validated in
+    batches. Valid rows are upserted with INSERT ... ON CONFLICT, and audit
+    entries are written in bulk, all in a single transaction. With dry_run,
+    nothing is written and the report shows what would have happened.
+
+    Args:
+        stream: Binary file-like object containing UTF-8 CSV data
+        username (str): The user performing the import, for the audit log
+        dry_run (bool): Only report what the import would do
+        batch_size (int, optional): Rows validated and written per batch;
+            defaults to DB_BULK_PAGE_SIZE
+
+    Returns:
+        dict: Counts of 'inserted', 'updated', 'unchanged' and 'errors' rows,
+        the first few 'error_messages', and 'dry_run'
+
+    Raises:
+        ControlImportError: If the file is not a readable CSV with the required columns
+        Exception: If the database write fails; nothing is saved
+    """
+    if batch_size is None:
+        batch_size = current_app.config.get('DB_BULK_PAGE_SIZE', 1000)
+
+    report = {
+        'inserted': 0,
+        'updated': 0,
+        'unchanged': 0,
+        'errors': 0,
+        'error_messages': [],
+        'dry_run': dry_run
+    }
+
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    try:
+        reader = csv.DictReader(text)
+        missing = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing:
+            raise ControlImportError(f"Missing required column(s): {', '.join(missing)}")
+
+        if dry_run:
+            for batch in _iter_batches(reader, batch_size, report):
+                existing = Control.get_by_ids(values[0] for values in batch)
+                for values in batch:
+                    control = existing.get(values[0])
+                    if control is None:
+                        report['inserted'] += 1
+                    elif _comparable(control.values()) != values:
+                        report['updated'] += 1
+                    else:
+                        report['unchanged'] += 1
+            return report
+
+        with transaction() as tx:
+            for batch in _iter_batches(reader, batch_size, report):
+                results = Control.upsert_many(batch, page_size=len(batch))
+                inserted = sum(1 for _, was_inserted in results if was_inserted)
+                report['inserted'] += inserted
+                report['updated'] += len(results) - inserted
+                report['unchanged'] += len(batch) - len(results)
+
+                add_audit_logs(
+                    (
+                        username,
+                        'Import Control',
+                        'Control',
+                        control_id,
+                        'Created from CSV import' if was_inserted else 'Updated from CSV import'
+                    )
+                    for control_id, was_inserted in results
+                )
+
+        if not tx.committed:
+            raise Exception('Import transaction was rolled back')
+
+        return report
+    except UnicodeDecodeError:
+        raise ControlImportError('File must be UTF-8 encoded')
+    except csv.Error as e:
+        raise ControlImportError(f'Could not parse CSV: {e}')
+    finally:
+        # Don't let the wrapper close the underlying upload stream
+        text.detach()
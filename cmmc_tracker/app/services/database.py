@@ -4,12 +4,20 @@ import logging
 import threading
 import atexit
 import time
+import re
+import io
+import uuid
+import weakref
+from contextlib import contextmanager
+from itertools import islice
+from collections import OrderedDict
 import psycopg2
-from psycopg2.extras import DictCursor
+from psycopg2.extras import DictCursor, execute_values
 from psycopg2 import sql
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
 from psycopg2.pool import ThreadedConnectionPool
 from flask import current_app, g
-from app.utils.profiler import start_timer, stop_timer
+from app.utils.profiler import start_timer, stop_timer, increment_counter
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +28,22 @@ _pool_lock = threading.Lock()
 # Track connections globally by thread ID to avoid issues with g context
 _thread_local = threading.local()
 
+# Prepared statement caches, one per pooled connection. psycopg2 connections
+# don't accept extra attributes, so the caches are keyed weakly by connection
+# and disappear when the pool closes or replaces a connection.
+_statement_caches = weakref.WeakKeyDictionary()
+_statement_caches_lock = threading.Lock()
+
+# Only plain DML/queries are worth preparing; DDL and utility statements can't be
+_PREPARABLE_PREFIXES = ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH")
+_PLACEHOLDER_PATTERN = re.compile(r"%%|%s|%\(")
+
+# SQLSTATEs that mean a cached statement no longer matches the server
+_STALE_STATEMENT_CODES = {
+    '26000',  # invalid_sql_statement_name: the session lost the statement
+    '0A000',  # feature_not_supported: "cached plan must not change result type"
+}
+
 def get_pool():
     """
     Get or create the database connection pool.
@@ -125,6 +149,332 @@ def has_app_context():
     except RuntimeError:
         return False
 
+def convert_placeholders(query_str):
+    """
+    Convert a psycopg2 query string into a server-side PREPARE body.
+
+    ``%s`` placeholders become ``$1``, ``$2``, ... and ``%%`` becomes ``%``.
+
+    Args:
+        query_str (str): SQL using psycopg2 positional placeholders
+
+    Returns:
+        tuple: (converted SQL, number of parameters), or (None, 0) if the query
+        uses named placeholders and can't be converted
+    """
+    param_count = 0
+    parts = []
+    last = 0
+    for match in _PLACEHOLDER_PATTERN.finditer(query_str):
+        token = match.group(0)
+        if token == '%(':
+            return None, 0
+        parts.append(query_str[last:match.start()])
+        if token == '%%':
+            parts.append('%')
+        else:
+            param_count += 1
+            parts.append(f"${param_count}")
+        last = match.end()
+    parts.append(query_str[last:])
+    return ''.join(parts), param_count
+
+class StatementCache:
+    """
+    LRU cache of server-side prepared statements for a single connection.
+
+    A statement is only prepared once it has been executed ``threshold`` times
+    on the connection, so one-off queries don't pay the extra PREPARE round
+    trip. Evicted statements are deallocated the next time the connection is
+    idle, so a DEALLOCATE can never abort a caller's open transaction.
+    """
+
+    def __init__(self, max_size, threshold=2):
+        self.max_size = max_size
+        self.threshold = max(1, threshold)
+        self.statements = OrderedDict()  # cache key -> statement name
+        self.candidates = OrderedDict()  # cache key -> use count, or None if unpreparable
+        self.pending_deallocations = []
+        self.reset_pending = False
+        self._next_id = 0
+
+    def get(self, key):
+        """Return the prepared statement name for a key, marking it recently used."""
+        name = self.statements.get(key)
+        if name is not None:
+            self.statements.move_to_end(key)
+        return name
+
+    def should_prepare(self, key):
+        """Record a use of an uncached statement and decide whether to prepare it."""
+        uses = self.candidates.get(key, 0)
+        if uses is None:
+            return False
+        uses += 1
+        self.candidates[key] = uses
+        self.candidates.move_to_end(key)
+        while len(self.candidates) > self.max_size * 4:
+            self.candidates.popitem(last=False)
+        return uses >= self.threshold
+
+    def mark_unpreparable(self, key):
+        """Remember that the server refused to prepare a statement."""
+        self.candidates[key] = None
+        self.candidates.move_to_end(key)
+
+    def add(self, key):
+        """Allocate a statement name for a key, evicting the least recently used entry."""
+        self._next_id += 1
+        name = f"cmmc_stmt_{self._next_id}"
+        self.statements[key] = name
+        self.candidates.pop(key, None)
+        while len(self.statements) > self.max_size:
+            _, evicted = self.statements.popitem(last=False)
+            self.pending_deallocations.append(evicted)
+            increment_counter('statement_cache_evictions')
+        return name
+
+    def discard(self, key):
+        """Forget a statement that failed to prepare."""
+        self.statements.pop(key, None)
+
+    def invalidate(self):
+        """Drop every cached statement; the server side is cleared when idle."""
+        self.statements.clear()
+        self.candidates.clear()
+        self.pending_deallocations = []
+        self.reset_pending = True
+        increment_counter('statement_cache_resets')
+
+    def flush(self, conn):
+        """Deallocate evicted statements while the connection is idle."""
+        if not (self.reset_pending or self.pending_deallocations):
+            return
+        if conn.closed or conn.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+            return
+        try:
+            with conn.cursor() as cursor:
+                if self.reset_pending:
+                    cursor.execute("DEALLOCATE ALL")
+                else:
+                    for name in self.pending_deallocations:
+                        cursor.execute(f"DEALLOCATE {name}")
+            conn.commit()
+        except psycopg2.Error as e:
+            logger.debug(f"Error deallocating prepared statements: {e}")
+            conn.rollback()
+        self.pending_deallocations = []
+        self.reset_pending = False
+
+def get_statement_cache(conn):
+    """
+    Get the prepared statement cache for a connection.
+
+    Args:
+        conn: A psycopg2 connection
+
+    Returns:
+        StatementCache: The connection's cache, or None if caching is disabled
+    """
+    cache = _statement_caches.get(conn)
+    if cache is not None:
+        return cache
+
+    max_size = 0
+    threshold = 2
+    if has_app_context():
+        max_size = current_app.config.get('DB_STATEMENT_CACHE_SIZE', 0)
+        threshold = current_app.config.get('DB_STATEMENT_PREPARE_THRESHOLD', 2)
+    if max_size <= 0:
+        return None
+
+    with _statement_caches_lock:
+        cache = _statement_caches.get(conn)
+        if cache is None:
+            cache = StatementCache(max_size, threshold)
+            _statement_caches[conn] = cache
+    return cache
+
+def reset_statement_cache(conn):
+    """
+    Invalidate all prepared statements held for a connection.
+
+    Call this whenever a pooled connection's session state is reset (for
+    example after DISCARD ALL or a schema change) so stale statement names
+    are never executed.
+    """
+    cache = _statement_caches.get(conn)
+    if cache is not None:
+        cache.invalidate()
+        cache.flush(conn)
+
+def _execute_statement(conn, cursor, query, params):
+    """Execute a query, going through the connection's prepared statement cache."""
+    cache = get_statement_cache(conn)
+    if cache is None:
+        cursor.execute(query, params)
+        return
+
+    cache.flush(conn)
+
+    if isinstance(query, sql.Composable):
+        query_str = query.as_string(conn)
+    else:
+        query_str = str(query)
+
+    if (not query_str.lstrip().upper().startswith(_PREPARABLE_PREFIXES)
+            or isinstance(params, dict)
+            or conn.get_transaction_status() not in (TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS)):
+        cursor.execute(query, params)
+        return
+
+    # psycopg2 only interpolates (and unescapes %%) when params are given
+    key = (query_str, params is not None)
+    name = cache.get(key)
+    if name is not None:
+        increment_counter('statement_cache_hits')
+        _execute_prepared(cursor, name, params)
+        return
+
+    increment_counter('statement_cache_misses')
+    if not cache.should_prepare(key):
+        cursor.execute(query, params)
+        return
+
+    if params is None:
+        body, param_count = query_str, 0
+    else:
+        body, param_count = convert_placeholders(query_str)
+    if body is None or param_count != len(params or ()):
+        # Let psycopg2 report the mismatch the usual way
+        cache.mark_unpreparable(key)
+        cursor.execute(query, params)
+        return
+
+    name = cache.add(key)
+    in_transaction = conn.get_transaction_status() == TRANSACTION_STATUS_INTRANS
+    try:
+        if in_transaction:
+            cursor.execute("SAVEPOINT cmmc_prepare")
+        cursor.execute(f"PREPARE {name} AS {body}")
+        if in_transaction:
+            cursor.execute("RELEASE SAVEPOINT cmmc_prepare")
+    except psycopg2.Error as e:
+        # Parameters whose type can't be inferred, etc. Fall back to a plain execute.
+        logger.debug(f"Could not prepare statement, executing directly: {e}")
+        if in_transaction:
+            cursor.execute("ROLLBACK TO SAVEPOINT cmmc_prepare")
+            cursor.execute("RELEASE SAVEPOINT cmmc_prepare")
+        else:
+            conn.rollback()
+        cache.discard(key)
+        cache.mark_unpreparable(key)
+        cursor.execute(query, params)
+        return
+
+    _execute_prepared(cursor, name, params)
+
+def _execute_prepared(cursor, name, params):
+    """Run EXECUTE for a prepared statement, letting psycopg2 adapt the parameters."""
+    if params:
+        placeholders = ', '.join(['%s'] * len(params))
+        cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+    else:
+        cursor.execute(f"EXECUTE {name}")
+
+class Transaction:
+    """
+    State of the outermost ``transaction()`` block running on this thread.
+
+    Attributes:
+        connection: The connection every write in the block goes through
+        rollback_only (bool): Set when any statement in the block failed;
+            the block will roll back instead of committing
+        committed (bool): True once the outermost block has committed
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rollback_only = False
+        self.committed = False
+
+    def set_rollback_only(self):
+        """Make the transaction roll back when the outermost block exits."""
+        self.rollback_only = True
+
+def get_current_transaction():
+    """Return the active Transaction for this thread, or None outside transaction()."""
+    return getattr(_thread_local, 'transaction', None)
+
+def in_transaction():
+    """Check whether the current thread is inside a transaction() block."""
+    return get_current_transaction() is not None
+
+@contextmanager
+def transaction():
+    """
+    Group several writes into a single database transaction.
+
+    Model methods and audit logging called inside the block join it
+    implicitly: their ``commit=True`` calls are deferred, and the outermost
+    block commits once on exit. If any statement fails (even one whose
+    error a model swallowed) or an exception escapes the block, everything
+    is rolled back. Blocks may be nested; only the outermost one commits.
+
+    Usage::
+
+        with transaction() as tx:
+            if task.complete():
+                add_audit_log(username, 'Complete Task', 'Task', task_id)
+        if tx.committed:
+            send_task_notification(task_id, 'completed')
+
+    Yields:
+        Transaction: The state of the outermost transaction
+    """
+    current = get_current_transaction()
+    if current is not None:
+        try:
+            yield current
+        except BaseException:
+            current.set_rollback_only()
+            raise
+        return
+
+    conn = get_db_connection()
+    tx = Transaction(conn)
+    _thread_local.transaction = tx
+    try:
+        yield tx
+    except BaseException:
+        tx.set_rollback_only()
+        raise
+    finally:
+        del _thread_local.transaction
+        if tx.rollback_only:
+            conn.rollback()
+            logger.debug("Transaction rolled back")
+        else:
+            try:
+                conn.commit()
+                tx.committed = True
+            except psycopg2.Error as e:
+                conn.rollback()
+                logger.error(f"Database error on commit: {e}")
+                raise Exception(f"Database operation failed: {str(e)}")
+
+def _commit(conn):
+    """Commit unless a transaction() block will commit for us."""
+    if not in_transaction():
+        conn.commit()
+
+def _rollback(conn):
+    """Roll back, marking any enclosing transaction() block as failed."""
+    conn.rollback()
+    tx = get_current_transaction()
+    if tx is not None:
+        tx.set_rollback_only()
+
 def execute_query(query, params=None, fetch_one=False, fetch_all=False, commit=False, query_name=None):
     """
     Execute a database query with standardized error handling.
@@ -164,13 +514,20 @@ def execute_query(query, params=None, fetch_one=False, fetch_all=False, commit=F
     try:
         conn = get_db_connection()
         cursor = conn.cursor(cursor_factory=DictCursor)
+        was_idle = conn.get_transaction_status() == TRANSACTION_STATUS_IDLE
 
-        # Handle different query types
-        if isinstance(query, sql.Composable):
-            # It's a SQL composition object
-            cursor.execute(query, params)
-        else:
-            # It's a regular string query
+        try:
+            _execute_statement(conn, cursor, query, params)
+        except psycopg2.Error as e:
+            if e.pgcode not in _STALE_STATEMENT_CODES or not was_idle:
+                raise
+            # The session's prepared statements no longer match the server
+            # (e.g. after a schema change). Nothing else was in the
+            # transaction, so it is safe to reset and run the query again.
+            logger.info(f"Resetting prepared statement cache after error: {e}")
+            conn.rollback()
+            reset_statement_cache(conn)
+            cursor = conn.cursor(cursor_factory=DictCursor)
             cursor.execute(query, params)
 
         result = None
@@ -180,7 +537,7 @@ def execute_query(query, params=None, fetch_one=False, fetch_all=False, commit=F
             result = cursor.fetchall()
 
         if commit:
-            conn.commit()
+            _commit(conn)
 
         # Stop timing and log
         elapsed = stop_timer(timer_name)
@@ -190,7 +547,9 @@ def execute_query(query, params=None, fetch_one=False, fetch_all=False, commit=F
         return result
     except psycopg2.Error as e:
         if conn:
-            conn.rollback()
+            _rollback(conn)
+            if e.pgcode in _STALE_STATEMENT_CODES:
+                reset_statement_cache(conn)
         logger.error(f"Database error: {e}")
         # Rethrow as a custom exception that can be caught and handled appropriately
         raise Exception(f"Database operation failed: {str(e)}")
@@ -198,6 +557,51 @@ def execute_query(query, params=None, fetch_one=False, fetch_all=False, commit=F
         # Don't close connections here, they're managed by thread local and app context
         pass
 
+def stream_query(query, params=None, itersize=None, query_name=None):
+    """
+    Iterate over the rows of a query using a server-side (named) cursor.
+
+    Rows are fetched from PostgreSQL ``itersize`` at a time
+    (DB_STREAM_ITERSIZE by default), so memory stays flat no matter how
+    many rows the query returns. The cursor keeps a transaction open on the
+    thread's connection until iteration finishes or the generator is closed.
+
+    Args:
+        query (str or sql.Composable): SQL query to execute
+        params (tuple, optional): Parameters for the query
+        itersize (int, optional): Number of rows fetched per round trip
+        query_name (str, optional): Name for profiling the query
+
+    Yields:
+        DictRow: Each row of the result
+    """
+    if itersize is None:
+        itersize = current_app.config.get('DB_STREAM_ITERSIZE', 2000) if has_app_context() else 2000
+
+    timer_name = f"db_stream_{query_name or 'query'}"
+    start_timer(timer_name)
+
+    conn = get_db_connection()
+    cursor = conn.cursor(name=f"cmmc_stream_{uuid.uuid4().hex}", cursor_factory=DictCursor)
+    cursor.itersize = itersize
+
+    try:
+        cursor.execute(query, params)
+        for row in cursor:
+            yield row
+    except psycopg2.Error as e:
+        _rollback(conn)
+        logger.error(f"Database error: {e}")
+        raise Exception(f"Database operation failed: {str(e)}")
+    finally:
+        if not cursor.closed and not conn.closed:
+            try:
+                cursor.close()
+            except psycopg2.Error:
+                # The transaction was already aborted; the cursor went with it
+                pass
+        stop_timer(timer_name)
+
 def release_connection():
     """Release the current thread's database connection back to the pool."""
     thread_id = threading.get_ident()
@@ -415,9 +819,24 @@ def count(table, where_clause=None, params=None):
     result = execute_query(query, params, fetch_one=True)
     return result[0]
 
+def escape_like(term):
+    """
+    Escape LIKE/ILIKE wildcards so a user's search term matches literally.
+
+    Args:
+        term (str): The raw search term
+
+    Returns:
+        str: The term with backslash, % and _ escaped
+    """
+    return term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
 def search(table, columns, search_term, limit=None, offset=None):
     """
-    Search for records in a table.
+    Search for records in a table with a case-insensitive substring match.
+
+    This is an unindexed scan meant for small tables; controls have a
+    dedicated full-text search in app.services.search.
 
     Args:
         table (str): The table name
@@ -432,7 +851,7 @@ def search(table, columns, search_term, limit=None, offset=None):
     like_clauses = []
     for column in columns:
         like_clauses.append(
-            sql.SQL("{} LIKE %s").format(sql.Identifier(column))
+            sql.SQL("{} ILIKE %s").format(sql.Identifier(column))
         )
 
     where_clause = sql.SQL(" OR ").join(like_clauses)
@@ -452,10 +871,238 @@ def search(table, columns, search_term, limit=None, offset=None):
     query = sql.SQL(" ").join(query_parts)
 
     # Prepare parameters with wildcards
-    params = [f"%{search_term}%"] * len(columns)
+    params = [f"%{escape_like(search_term)}%"] * len(columns)
     if limit:
         params.append(limit)
     if offset:
         params.append(offset)
 
-    return execute_query(query, params, fetch_all=True)
\ No newline at end of file
+    return execute_query(query, params, fetch_all=True)
+
+def _bulk_page_size(page_size=None):
+    """Resolve the batch size for bulk helpers, defaulting to DB_BULK_PAGE_SIZE."""
+    if page_size:
+        return page_size
+    if has_app_context():
+        return current_app.config.get('DB_BULK_PAGE_SIZE', 1000)
+    return 1000
+
+def _iter_batches(rows, columns, page_size):
+    """Yield lists of row tuples from an iterable of tuples or dicts."""
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, page_size))
+        if not batch:
+            return
+        yield [
+            tuple(row.get(column) for column in columns) if isinstance(row, dict) else tuple(row)
+            for row in batch
+        ]
+
+def _execute_batches(query, columns, rows, page_size, fetch, timer_name, dedupe_on=None):
+    """
+    Run an execute_values statement for each batch of rows, one transaction per batch.
+
+    Args:
+        query (sql.Composable): Statement with a single ``VALUES %s`` placeholder
+        columns (list): Column names, in the order values appear in each row
+        rows (iterable): Row tuples or dicts
+        page_size (int): Number of rows per batch
+        fetch (bool): Whether to collect RETURNING rows
+        timer_name (str): Name for profiling
+        dedupe_on (list, optional): Columns that must be unique within a batch;
+            later rows win
+
+    Returns:
+        list or int: Returned rows if fetch is True, otherwise the row count
+    """
+    conn = None
+    results = []
+    row_count = 0
+    start_timer(timer_name)
+
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor(cursor_factory=DictCursor)
+        query_str = query.as_string(conn)
+        key_indexes = [columns.index(column) for column in dedupe_on] if dedupe_on else None
+
+        for batch in _iter_batches(rows, columns, page_size):
+            if key_indexes:
+                # ON CONFLICT DO UPDATE can't touch the same row twice in one statement
+                batch = list({tuple(row[i] for i in key_indexes): row for row in batch}.values())
+
+            returned = execute_values(cursor, query_str, batch, page_size=len(batch), fetch=fetch)
+            if fetch:
+                results.extend(returned)
+            row_count += cursor.rowcount
+            _commit(conn)
+
+        elapsed = stop_timer(timer_name)
+        if elapsed and elapsed > 1.0:
+            logger.debug(f"Slow bulk operation ({elapsed:.4f}s): {timer_name}")
+
+        return results if fetch else row_count
+    except psycopg2.Error as e:
+        if conn:
+            _rollback(conn)
+        logger.error(f"Database error: {e}")
+        raise Exception(f"Database operation failed: {str(e)}")
+
+def insert_many(table, columns, rows, page_size=None, returning=None):
+    """
+    Insert many records with multi-row INSERT statements.
+
+    Rows are sent in batches of ``page_size`` (DB_BULK_PAGE_SIZE by default),
+    each batch in its own transaction, so a failure only rolls back the
+    batch that failed. Inside a ``transaction()`` block all batches join
+    the enclosing transaction instead.
+
+    Args:
+        table (str): The table name
+        columns (list): The column names
+        rows (iterable): Row tuples in column order, or dicts keyed by column
+        page_size (int, optional): Number of rows per batch
+        returning (str, optional): RETURNING expression list, e.g. ``"controlid"``
+
+    Returns:
+        list or int: The returned rows if ``returning`` is given, otherwise
+        the number of rows inserted
+    """
+    query = sql.SQL("INSERT INTO {} ({}) VALUES %s").format(
+        sql.Identifier(table),
+        sql.SQL(', ').join(map(sql.Identifier, columns))
+    )
+    if returning:
+        query = sql.SQL("{} RETURNING {}").format(query, sql.SQL(returning))
+
+    return _execute_batches(
+        query, list(columns), rows, _bulk_page_size(page_size),
+        fetch=bool(returning), timer_name=f"db_insert_many_{table}"
+    )
+
+def upsert_many(table, columns, rows, conflict_columns, update_columns=None, page_size=None, returning=None,
+                only_changed=False):
+    """
+    Insert many records, updating the ones that already exist.
+
+    Uses ``INSERT ... ON CONFLICT (...) DO UPDATE`` in batches of
+    ``page_size``, one transaction per batch. If a batch contains the same
+    key more than once, the last row wins.
+
+    Args:
+        table (str): The table name
+        columns (list): The column names
+        rows (iterable): Row tuples in column order, or dicts keyed by column
+        conflict_columns (list): Columns of the unique constraint to upsert on
+        update_columns (list, optional): Columns to overwrite on conflict;
+            defaults to every non-key column. An empty list means DO NOTHING.
+        page_size (int, optional): Number of rows per batch
+        returning (str, optional): RETURNING expression list, e.g.
+            ``"controlid, (xmax = 0) AS inserted"``
+        only_changed (bool): Skip the update (and leave no dead tuple) when an
+            existing row already holds the same values; such rows are not
+            returned or counted
+
+    Returns:
+        list or int: The returned rows if ``returning`` is given, otherwise
+        the number of rows inserted or updated
+    """
+    columns = list(columns)
+    if update_columns is None:
+        update_columns = [column for column in columns if column not in conflict_columns]
+
+    if update_columns:
+        conflict_action = sql.SQL("DO UPDATE SET {}").format(
+            sql.SQL(', ').join(
+                sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(column))
+                for column in update_columns
+            )
+        )
+        if only_changed:
+            conflict_action = sql.SQL("{} WHERE ({}) IS DISTINCT FROM ({})").format(
+                conflict_action,
+                sql.SQL(', ').join(sql.Identifier(table, column) for column in update_columns),
+                sql.SQL(', ').join(sql.Identifier('excluded', column) for column in update_columns)
+            )
+    else:
+        conflict_action = sql.SQL("DO NOTHING")
+
+    query = sql.SQL("INSERT INTO {} ({}) VALUES %s ON CONFLICT ({}) {}").format(
+        sql.Identifier(table),
+        sql.SQL(', ').join(map(sql.Identifier, columns)),
+        sql.SQL(', ').join(map(sql.Identifier, conflict_columns)),
+        conflict_action
+    )
+    if returning:
+        query = sql.SQL("{} RETURNING {}").format(query, sql.SQL(returning))
+
+    return _execute_batches(
+        query, columns, rows, _bulk_page_size(page_size),
+        fetch=bool(returning), timer_name=f"db_upsert_many_{table}",
+        dedupe_on=list(conflict_columns)
+    )
+
+def _copy_value(value):
+    """Format a value for COPY's text format, where NULL is written as \\N."""
+    if value is None:
+        return '\\N'
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+def copy_rows(table, columns, rows, page_size=None):
+    """
+    Load many records with COPY FROM STDIN.
+
+    This is the fastest way to load large volumes of new rows. It has no
+    conflict handling, so use upsert_many for data that may already exist.
+    Each batch of ``page_size`` rows is copied and committed separately.
+
+    Args:
+        table (str): The table name
+        columns (list): The column names
+        rows (iterable): Row tuples in column order, or dicts keyed by column
+        page_size (int, optional): Number of rows per batch
+
+    Returns:
+        int: The number of rows copied
+    """
+    columns = list(columns)
+    conn = None
+    row_count = 0
+    timer_name = f"db_copy_rows_{table}"
+    start_timer(timer_name)
+
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        copy_sql = sql.SQL("COPY {} ({}) FROM STDIN").format(
+            sql.Identifier(table),
+            sql.SQL(', ').join(map(sql.Identifier, columns))
+        ).as_string(conn)
+
+        for batch in _iter_batches(rows, columns, _bulk_page_size(page_size)):
+            buffer = io.StringIO()
+            for row in batch:
+                buffer.write('\t'.join(_copy_value(value) for value in row))
+                buffer.write('\n')
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+            row_count += cursor.rowcount
+            _commit(conn)
+
+        elapsed = stop_timer(timer_name)
+        if elapsed and elapsed > 1.0:
+            logger.debug(f"Slow bulk operation ({elapsed:.4f}s): {timer_name}")
+
+        return row_count
+    except psycopg2.Error as e:
+        if conn:
+            _rollback(conn)
+        logger.error(f"Database error: {e}")
+        raise Exception(f"Database operation failed: {str(e)}")
@@ -0,0 +1,168 @@
+"""Streaming CSV export service for the CMMC Tracker application."""
+
+import csv
+import io
+import logging
+from datetime import datetime
+from flask import Response, stream_with_context
+from app.services.database import stream_query
+from app.utils.date import format_date
+
+logger = logging.getLogger(__name__)
+
+# Number of CSV rows buffered before a chunk is sent to the client
+CSV_CHUNK_ROWS = 500
+
+CONTROL_EXPORT_HEADER = ['Control ID', 'Control Name', 'Control Description', 'NIST Mapping',
+                         'Review Frequency', 'Last Review Date', 'Next Review Date']
+
+TASK_EXPORT_HEADER = ['Task ID', 'Control ID', 'Control Name', 'Task Description', 'Assigned To',
+                      'Reviewer', 'Due Date', 'Status', 'Confirmed']
+
+EVIDENCE_EXPORT_HEADER = ['Evidence ID', 'Control ID', 'Title', 'Description', 'File Type', 'File Size',
+                          'Uploaded By', 'Upload Date', 'Expiration Date', 'Status']
+
+AUDIT_LOG_EXPORT_HEADER = ['Log ID', 'Timestamp', 'Username', 'Action', 'Object Type', 'Object ID', 'Details']
+
+def generate_csv(header, rows, chunk_rows=CSV_CHUNK_ROWS):
+    """
+    Generate CSV text in chunks.
+
+    Args:
+        header (list): Column headings for the first line
+        rows (iterable): Row sequences, consumed lazily
+        chunk_rows (int): Number of rows per yielded chunk
+
+    Yields:
+        str: A chunk of CSV text
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    pending = 1
+
+    try:
+        for row in rows:
+            writer.writerow(row)
+            pending += 1
+            if pending >= chunk_rows:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+                pending = 0
+    except Exception as e:
+        # Headers are already sent, so the best we can do is end the file early
+        logger.error(f"Error streaming CSV export: {e}")
+
+    if pending:
+        yield buffer.getvalue()
+
+def csv_response(filename_prefix, header, rows):
+    """
+    Build a streaming CSV attachment response.
+
+    Args:
+        filename_prefix (str): Prefix for the download name; the date is appended
+        header (list): Column headings
+        rows (iterable): Row sequences, consumed lazily while the response is sent
+
+    Returns:
+        Response: A streaming text/csv response
+    """
+    filename = f"{filename_prefix}_{datetime.now().strftime('%Y%m%d')}.csv"
+    return Response(
+        stream_with_context(generate_csv(header, rows)),
+        mimetype='text/csv',
+        headers={'Content-Disposition': f'attachment;filename={filename}'}
+    )
+
+def iter_control_rows():
+    """Yield control export rows from a server-side cursor."""
+    query = """
+        SELECT controlid, controlname, controldescription, nist_sp_800_171_mapping,
+               policyreviewfrequency, lastreviewdate, nextreviewdate
+        FROM controls
+        ORDER BY controlid
+    """
+    for row in stream_query(query, query_name='export_controls'):
+        yield [
+            row['controlid'],
+            row['controlname'],
+            row['controldescription'],
+            row['nist_sp_800_171_mapping'],
+            row['policyreviewfrequency'],
+            format_date(row['lastreviewdate']) if row['lastreviewdate'] else '',
+            format_date(row['nextreviewdate']) if row['nextreviewdate'] else ''
+        ]
+
+def iter_task_rows():
+    """Yield task export rows, including each task's control name."""
+    query = """
+        SELECT t.taskid, t.controlid, c.controlname, t.taskdescription, t.assignedto,
+               t.reviewer, t.duedate, t.status, t.confirmed
+        FROM tasks t
+        LEFT JOIN controls c ON c.controlid = t.controlid
+        ORDER BY t.taskid
+    """
+    for row in stream_query(query, query_name='export_tasks'):
+        yield [
+            row['taskid'],
+            row['controlid'],
+            row['controlname'],
+            row['taskdescription'],
+            row['assignedto'],
+            row['reviewer'],
+            format_date(row['duedate']) if row['duedate'] else '',
+            row['status'],
+            'Yes' if row['confirmed'] else 'No'
+        ]
+
+def iter_evidence_rows(control_id=None):
+    """
+    Yield evidence metadata export rows.
+
+    Args:
+        control_id (str, optional): Only export evidence for this control
+    """
+    query = """
+        SELECT evidenceid, controlid, title, description, filetype, filesize,
+               uploadedby, uploaddate, expirationdate, status
+        FROM evidence
+    """
+    params = None
+    if control_id:
+        query += " WHERE controlid = %s"
+        params = (control_id,)
+    query += " ORDER BY evidenceid"
+
+    for row in stream_query(query, params, query_name='export_evidence'):
+        yield [
+            row['evidenceid'],
+            row['controlid'],
+            row['title'],
+            row['description'],
+            row['filetype'],
+            row['filesize'],
+            row['uploadedby'],
+            format_date(row['uploaddate']) if row['uploaddate'] else '',
+            format_date(row['expirationdate']) if row['expirationdate'] else '',
+            row['status']
+        ]
+
+def iter_audit_log_rows():
+    """Yield audit log export rows, newest first."""
+    query = """
+        SELECT logid, timestamp, username, action, objecttype, objectid, details
+        FROM auditlogs
+        ORDER BY logid DESC
+    """
+    for row in stream_query(query, query_name='export_audit_logs'):
+        yield [
+            row['logid'],
+            row['timestamp'].isoformat() if row['timestamp'] else '',
+            row['username'],
+            row['action'],
+            row['objecttype'],
+            row['objectid'],
+            row['details']
+        ]
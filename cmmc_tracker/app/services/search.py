@@ -0,0 +1,90 @@
+"""Control search service for the CMMC Tracker application."""
+
+import logging
+from app.services.database import execute_query, escape_like
+
+logger = logging.getLogger(__name__)
+
+# Columns that can be used instead of relevance to order search results
+SORT_COLUMNS = ['controlid', 'controlname', 'nextreviewdate']
+
+# Matches the full-text column (GIN index) or a case-insensitive substring of
+# the control ID (trigram index), so "ac.l2-3.1" and "access control" both work
+_MATCH_CLAUSE = """
+    c.search_vector @@ websearch_to_tsquery('english', %s)
+    OR c.controlid ILIKE %s
+"""
+
+def _match_params(term):
+    """Parameters for _MATCH_CLAUSE."""
+    return [term, f"%{escape_like(term)}%"]
+
+def search_controls(search_term, limit=10, offset=0, sort_by='relevance', sort_order='asc'):
+    """
+    Search controls by ID, name and description.
+
+    Results are ranked with exact and prefix ID matches first, then by
+    full-text relevance. The total number of matches comes back with the
+    page itself, so a paged search is a single query.
+
+    Args:
+        search_term (str): Words, "quoted phrases" or a control ID (prefix)
+        limit (int): Maximum number of results to return
+        offset (int): Number of results to skip
+        sort_by (str): 'relevance' or one of SORT_COLUMNS
+        sort_order (str): 'asc' or 'desc', for SORT_COLUMNS only
+
+    Returns:
+        tuple: (list of control rows, total number of matches)
+    """
+    term = (search_term or '').strip()
+    if not term:
+        return [], 0
+
+    if sort_by in SORT_COLUMNS:
+        order_by = f"c.{sort_by} {'DESC' if sort_order == 'desc' else 'ASC'}, c.controlid"
+        order_params = []
+    else:
+        order_by = "lower(c.controlid) = lower(%s) DESC, c.controlid ILIKE %s DESC, rank DESC, c.controlid"
+        order_params = [term, f"{escape_like(term)}%"]
+
+    query = f"""
+        SELECT c.controlid, c.controlname, c.controldescription, c.nist_sp_800_171_mapping,
+               c.policyreviewfrequency, c.lastreviewdate, c.nextreviewdate,
+               ts_rank_cd(c.search_vector, websearch_to_tsquery('english', %s)) AS rank,
+               COUNT(*) OVER () AS total_count
+        FROM controls c
+        WHERE {_MATCH_CLAUSE}
+        ORDER BY {order_by}
+        LIMIT %s OFFSET %s
+    """
+    params = [term] + _match_params(term) + order_params + [limit, offset]
+    rows = execute_query(query, params, query_name="search_controls", fetch_all=True)
+
+    if rows:
+        total = rows[0]['total_count']
+    elif offset:
+        # Paged past the end, so the window count isn't available
+        total = count_controls(term)
+    else:
+        total = 0
+
+    return rows, total
+
+def count_controls(search_term):
+    """
+    Count the controls matching a search term.
+
+    Args:
+        search_term (str): The search term
+
+    Returns:
+        int: The number of matching controls
+    """
+    term = (search_term or '').strip()
+    if not term:
+        return 0
+
+    query = f"SELECT COUNT(*) FROM controls c WHERE {_MATCH_CLAUSE}"
+    result = execute_query(query, _match_params(term), query_name="count_controls", fetch_one=True)
+    return result[0]
@@ -9,13 +9,19 @@ def parse_date(date_str):
     """
     Parse a date string into a date object.
     Returns None if the date string is invalid or empty.
+    Date objects (as returned for DATE columns) are passed through untouched,
+    and datetimes are reduced to their date.
     
     Args:
-        date_str (str): A date string in YYYY-MM-DD format
+        date_str (str or date): A date string in YYYY-MM-DD format or a date object
         
     Returns:
         date: A date object or None if invalid
     """
+    if isinstance(date_str, datetime):
+        return date_str.date()
+    if isinstance(date_str, date):
+        return date_str
     if not date_str or date_str.strip() == '':
         return None
         
@@ -40,6 +46,8 @@ def format_date(date_obj):
         return ''
         
     try:
+        if isinstance(date_obj, datetime):
+            date_obj = date_obj.date()
         if isinstance(date_obj, str):
             # If it's already a string, try to parse and format it
             parsed = parse_date(date_obj)
@@ -3,6 +3,7 @@
 import time
 import logging
 import functools
+import threading
 from flask import g, request, current_app
 
 # Avoid circular imports
@@ -13,6 +14,10 @@ logger = logging.getLogger(__name__)
 # Dictionary to store profiling data
 _profiling_data = {}
 
+# Named event counters (e.g. statement cache hits/misses)
+_counters = {}
+_counters_lock = threading.Lock()
+
 def start_timer(name):
     """Start a timer for profiling."""
     if not hasattr(g, 'timers'):
@@ -36,10 +41,22 @@ def get_average_time(name):
         return sum(_profiling_data[name]) / len(_profiling_data[name])
     return None
 
+def increment_counter(name, amount=1):
+    """Increment a named profiling counter."""
+    with _counters_lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+def get_counters():
+    """Get a snapshot of all profiling counters."""
+    with _counters_lock:
+        return dict(_counters)
+
 def clear_profiling_data():
     """Clear all profiling data."""
     global _profiling_data
     _profiling_data = {}
+    with _counters_lock:
+        _counters.clear()
 
 def get_profiling_data():
     """Get all profiling data."""
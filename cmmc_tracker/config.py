@@ -20,6 +20,16 @@ class Config:
     DB_POOL_MAX_CONN = int(os.environ.get('DB_POOL_MAX_CONN', 10))
     DB_POOL_IDLE_TIMEOUT = int(os.environ.get('DB_POOL_IDLE_TIMEOUT', 60))  # seconds
 
+    # Server-side prepared statement cache (per pooled connection, 0 disables)
+    DB_STATEMENT_CACHE_SIZE = int(os.environ.get('DB_STATEMENT_CACHE_SIZE', 100))
+    DB_STATEMENT_PREPARE_THRESHOLD = int(os.environ.get('DB_STATEMENT_PREPARE_THRESHOLD', 2))  # executions before PREPARE
+
+    # Rows per batch (and per transaction) for insert_many/upsert_many/copy_rows
+    DB_BULK_PAGE_SIZE = int(os.environ.get('DB_BULK_PAGE_SIZE', 1000))
+
+    # Rows fetched per round trip by server-side cursors (stream_query / CSV exports)
+    DB_STREAM_ITERSIZE = int(os.environ.get('DB_STREAM_ITERSIZE', 2000))
+
     # Database URI for SQLAlchemy (if you decide to use it)
     SQLALCHEMY_DATABASE_URI = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
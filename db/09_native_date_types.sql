@@ -0,0 +1,76 @@
+-- Native date types migration
+-- Converts the TEXT review dates, task due dates and audit log timestamps to
+-- DATE/TIMESTAMPTZ and indexes them so date range queries can use the index
+
+-- Lenient converters: values that don't parse are logged and stored as NULL
+-- rather than aborting the whole migration
+CREATE OR REPLACE FUNCTION pg_temp.try_cast_date(value TEXT) RETURNS DATE AS $$
+BEGIN
+    RETURN NULLIF(btrim(value), '')::DATE;
+EXCEPTION WHEN others THEN
+    RAISE WARNING 'Could not convert "%" to a date, storing NULL', value;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION pg_temp.try_cast_timestamptz(value TEXT) RETURNS TIMESTAMPTZ AS $$
+BEGIN
+    RETURN NULLIF(btrim(value), '')::TIMESTAMPTZ;
+EXCEPTION WHEN others THEN
+    RAISE WARNING 'Could not convert "%" to a timestamp, storing NULL', value;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    -- Controls review dates
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = current_schema() AND table_name = 'controls'
+               AND column_name = 'lastreviewdate' AND data_type = 'text') THEN
+        ALTER TABLE controls
+            ALTER COLUMN lastreviewdate TYPE DATE USING pg_temp.try_cast_date(lastreviewdate);
+        RAISE NOTICE 'Converted controls.lastreviewdate to DATE';
+    ELSE
+        RAISE NOTICE 'controls.lastreviewdate is already a native date';
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = current_schema() AND table_name = 'controls'
+               AND column_name = 'nextreviewdate' AND data_type = 'text') THEN
+        ALTER TABLE controls
+            ALTER COLUMN nextreviewdate TYPE DATE USING pg_temp.try_cast_date(nextreviewdate);
+        RAISE NOTICE 'Converted controls.nextreviewdate to DATE';
+    ELSE
+        RAISE NOTICE 'controls.nextreviewdate is already a native date';
+    END IF;
+
+    -- Task due dates
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = current_schema() AND table_name = 'tasks'
+               AND column_name = 'duedate' AND data_type = 'text') THEN
+        ALTER TABLE tasks
+            ALTER COLUMN duedate TYPE DATE USING pg_temp.try_cast_date(duedate);
+        RAISE NOTICE 'Converted tasks.duedate to DATE';
+    ELSE
+        RAISE NOTICE 'tasks.duedate is already a native date';
+    END IF;
+
+    -- Audit log timestamps (existing values were written with a UTC offset)
+    IF EXISTS (SELECT 1 FROM information_schema.columns
+               WHERE table_schema = current_schema() AND table_name = 'auditlogs'
+               AND column_name = 'timestamp' AND data_type = 'text') THEN
+        ALTER TABLE auditlogs
+            ALTER COLUMN timestamp TYPE TIMESTAMPTZ USING pg_temp.try_cast_timestamptz(timestamp);
+        RAISE NOTICE 'Converted auditlogs.timestamp to TIMESTAMPTZ';
+    ELSE
+        RAISE NOTICE 'auditlogs.timestamp is already a native timestamp';
+    END IF;
+
+    -- Indexes for date range scans
+    CREATE INDEX IF NOT EXISTS idx_tasks_duedate ON tasks(duedate);
+    CREATE INDEX IF NOT EXISTS idx_controls_nextreviewdate ON controls(nextreviewdate);
+    CREATE INDEX IF NOT EXISTS idx_auditlogs_timestamp ON auditlogs(timestamp);
+
+    RAISE NOTICE 'Ensured date indexes on tasks, controls and auditlogs';
+END $$;
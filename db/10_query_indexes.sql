@@ -0,0 +1,36 @@
+-- Query index migration
+-- Adds indexes for the task and audit log access paths used by the dashboard,
+-- reports, calendar and audit history pages
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name = 'tasks') THEN
+        -- Tasks for a control, in due date order
+        CREATE INDEX IF NOT EXISTS idx_tasks_controlid_duedate ON tasks(controlid, duedate);
+
+        -- Per-user and per-reviewer task lists and status counts
+        CREATE INDEX IF NOT EXISTS idx_tasks_assignedto_status ON tasks(assignedto, status, duedate);
+        CREATE INDEX IF NOT EXISTS idx_tasks_reviewer_status ON tasks(reviewer, status, duedate);
+
+        -- Open tasks only: overdue/due soon checks and "my tasks". Completed
+        -- tasks make up most of the table over time and are never queried here
+        CREATE INDEX IF NOT EXISTS idx_tasks_open_duedate ON tasks(duedate)
+            WHERE status <> 'Completed';
+        CREATE INDEX IF NOT EXISTS idx_tasks_open_assignedto ON tasks(assignedto, duedate)
+            WHERE status <> 'Completed';
+
+        RAISE NOTICE 'Ensured task indexes';
+    ELSE
+        RAISE NOTICE 'Tasks table does not exist. Skipping task indexes.';
+    END IF;
+
+    IF EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name = 'auditlogs') THEN
+        -- History for one object and activity for one user, newest first
+        CREATE INDEX IF NOT EXISTS idx_auditlogs_object ON auditlogs(objecttype, objectid, timestamp DESC);
+        CREATE INDEX IF NOT EXISTS idx_auditlogs_username ON auditlogs(username, timestamp DESC);
+
+        RAISE NOTICE 'Ensured audit log indexes';
+    ELSE
+        RAISE NOTICE 'Auditlogs table does not exist. Skipping audit log indexes.';
+    END IF;
+END $$;
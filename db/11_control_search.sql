@@ -0,0 +1,39 @@
+-- Control search migration
+-- Adds a weighted full-text search column to controls with a GIN index, and a
+-- trigram index on control IDs for case-insensitive ID and prefix matches
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM information_schema.columns
+                   WHERE table_schema = current_schema() AND table_name = 'controls'
+                   AND column_name = 'search_vector') THEN
+        -- IDs and names rank above description matches
+        ALTER TABLE controls ADD COLUMN search_vector tsvector
+            GENERATED ALWAYS AS (
+                setweight(to_tsvector('english', coalesce(controlid, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(controlname, '')), 'A') ||
+                setweight(to_tsvector('english', coalesce(controldescription, '')), 'B')
+            ) STORED;
+        RAISE NOTICE 'Added controls.search_vector column';
+    ELSE
+        RAISE NOTICE 'controls.search_vector column already exists';
+    END IF;
+
+    CREATE INDEX IF NOT EXISTS idx_controls_search_vector ON controls USING GIN (search_vector);
+END $$;
+
+-- pg_trgm ships with PostgreSQL contrib but creating it may need extra
+-- privileges. Search still works without it; ID matches just aren't indexed.
+DO $$
+BEGIN
+    BEGIN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    EXCEPTION WHEN others THEN
+        RAISE NOTICE 'Could not create pg_trgm extension (%). Skipping trigram index.', SQLERRM;
+    END;
+
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+        CREATE INDEX IF NOT EXISTS idx_controls_controlid_trgm ON controls USING GIN (controlid gin_trgm_ops);
+        RAISE NOTICE 'Ensured trigram index on controls.controlid';
+    END IF;
+END $$;
@@ -12,7 +12,7 @@ import os
 import json
 import psycopg2
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-from psycopg2.extras import DictCursor
+from psycopg2.extras import DictCursor, execute_values
 from werkzeug.security import generate_password_hash
 from datetime import datetime, date, timedelta, timezone
 import logging
@@ -276,47 +276,54 @@ def import_controls():
         
         logger.info(f"Importing {len(controls_data)} controls...")
         
-        # Import controls
-        for control in controls_data:
-            try:
-                cursor.execute('''
-                    INSERT INTO controls (
-                        controlid, 
-                        controlname, 
-                        controldescription, 
-                        nist_sp_800_171_mapping, 
-                        policyreviewfrequency
-                    ) VALUES (%s, %s, %s, %s, %s)
-                ''', (
+        # Import controls and their audit log entries with multi-row inserts
+        now = datetime.now(timezone.utc).isoformat()
+        try:
+            execute_values(cursor, '''
+                INSERT INTO controls (
+                    controlid, 
+                    controlname, 
+                    controldescription, 
+                    nist_sp_800_171_mapping, 
+                    policyreviewfrequency
+                ) VALUES %s
+                ON CONFLICT (controlid) DO NOTHING
+            ''', [
+                (
                     control.get("ControlID", ""),
                     control.get("ControlName", ""),
                     control.get("ControlDescription", ""),
                     control.get("NIST_SP_800_171_Mapping", ""),
                     "Annual"  # Default review frequency
-                ))
-                
-                # Add audit log
-                now = datetime.now(timezone.utc).isoformat()
-                cursor.execute('''
-                    INSERT INTO auditlogs (
-                        timestamp, 
-                        username, 
-                        action, 
-                        objecttype, 
-                        objectid, 
-                        details
-                    ) VALUES (%s, %s, %s, %s, %s, %s)
-                ''', (
+                )
+                for control in controls_data
+            ], page_size=1000)
+
+            execute_values(cursor, '''
+                INSERT INTO auditlogs (
+                    timestamp, 
+                    username, 
+                    action, 
+                    objecttype, 
+                    objectid, 
+                    details
+                ) VALUES %s
+            ''', [
+                (
                     now,
                     'SYSTEM',
                     'Create Control',
                     'Control',
                     control.get("ControlID", ""),
                     f"Control imported during database seeding: {control.get('ControlName', '')}"
-                ))
-                
-            except psycopg2.Error as e:
-                logger.error(f"Error importing control {control.get('ControlID', '')}: {e}")
+                )
+                for control in controls_data
+            ], page_size=1000)
+        except psycopg2.Error as e:
+            logger.error(f"Error importing controls: {e}")
+            conn.rollback()
+            conn.close()
+            return
         
         # Add review dates for a subset of controls
         today = date.today()
@@ -180,6 +180,22 @@ def init_database(app):
                 commit=True
             )
 
+            # Create audit logs table if it doesn't exist
+            execute_query(
+                """
+                CREATE TABLE IF NOT EXISTS auditlogs (
+                    logid SERIAL PRIMARY KEY,
+                    timestamp TIMESTAMPTZ NOT NULL,
+                    username VARCHAR(100) NOT NULL,
+                    action VARCHAR(100) NOT NULL,
+                    objecttype VARCHAR(50) NOT NULL,
+                    objectid VARCHAR(50),
+                    details TEXT
+                )
+                """,
+                commit=True
+            )
+
             # Create settings table if it doesn't exist
             execute_query(
                 """
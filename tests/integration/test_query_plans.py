@@ -0,0 +1,184 @@
+"""Query plan regression tests for the task and audit log indexes."""
+
+import json
+import os
+from datetime import date, timedelta
+import pytest
+from cmmc_tracker.app.models import audit as audit_module
+from cmmc_tracker.app.models import task as task_module
+from cmmc_tracker.app.models.audit import AuditLog
+from cmmc_tracker.app.models.task import Task
+from cmmc_tracker.app.services.database import transaction
+
+DB_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'db')
+MIGRATIONS = ['09_native_date_types.sql', '10_query_indexes.sql']
+
+INDEX_SCANS = {'Index Scan', 'Index Only Scan', 'Bitmap Index Scan'}
+
+SEED_SQL = """
+    INSERT INTO controls (controlid, controlname, policyreviewfrequency, lastreviewdate, nextreviewdate)
+    SELECT 'PLAN.' || n, 'Plan control ' || n, 'Annual',
+           %(today)s::date - 1000 + (n * 7) %% 1825,
+           %(today)s::date - 900 + (n * 7) %% 1825
+    FROM generate_series(1, 2000) AS n;
+
+    INSERT INTO tasks (controlid, taskdescription, assignedto, duedate, status, confirmed, reviewer)
+    SELECT 'PLAN.' || (n %% 2000 + 1), 'Plan task ' || n, 'planuser' || (n %% 50),
+           %(today)s::date - 700 + n %% 1400,
+           CASE n %% 40 WHEN 0 THEN 'Open' WHEN 1 THEN 'Pending Confirmation' ELSE 'Completed' END,
+           CASE WHEN n %% 40 > 1 THEN 1 ELSE 0 END,
+           'planreviewer' || (n %% 25)
+    FROM generate_series(1, 50000) AS n;
+
+    INSERT INTO auditlogs (timestamp, username, action, objecttype, objectid, details)
+    SELECT now() - n * interval '1 minute', 'planuser' || (n %% 50),
+           (ARRAY['created', 'updated', 'deleted', 'completed', 'confirmed'])[n %% 5 + 1],
+           (ARRAY['control', 'task', 'evidence', 'user'])[n %% 4 + 1],
+           (n %% 5000)::text, 'Synthetic entry'
+    FROM generate_series(1, 50000) AS n;
+
+    ANALYZE controls;
+    ANALYZE tasks;
+    ANALYZE auditlogs;
+"""
+
+@pytest.fixture
+def plan_cursor(init_database):
+    """
+    Apply the index migrations and load a large synthetic dataset.
+
+    Everything runs in one transaction that is rolled back afterwards, so the
+    shared test tables are left untouched.
+    """
+    with transaction() as tx:
+        cursor = tx.connection.cursor()
+        for name in MIGRATIONS:
+            with open(os.path.join(DB_DIR, name)) as f:
+                cursor.execute(f.read())
+        cursor.execute(SEED_SQL, {'today': date.today()})
+        yield cursor
+        tx.set_rollback_only()
+
+def _plan_nodes(plan):
+    """Yield every node of an EXPLAIN (FORMAT JSON) plan tree."""
+    yield plan
+    for child in plan.get('Plans', []):
+        yield from _plan_nodes(child)
+
+def assert_index_scan(cursor, relation, query, params=None):
+    """Assert the query reads relation through one of its indexes, never a sequential scan."""
+    cursor.execute("SELECT indexname FROM pg_indexes WHERE tablename = %s", (relation,))
+    relation_indexes = {row[0] for row in cursor.fetchall()}
+
+    cursor.execute('EXPLAIN (FORMAT JSON) ' + query, params)
+    result = cursor.fetchone()[0]
+    if isinstance(result, str):
+        result = json.loads(result)
+    nodes = list(_plan_nodes(result[0]['Plan']))
+
+    seq_scans = [n for n in nodes if n['Node Type'] == 'Seq Scan' and n.get('Relation Name') == relation]
+    index_scans = [n for n in nodes if n['Node Type'] in INDEX_SCANS and n.get('Index Name') in relation_indexes]
+    assert not seq_scans, f"Sequential scan on {relation}: {json.dumps(result)}"
+    assert index_scans, f"No index scan on {relation}: {json.dumps(result)}"
+    return {n['Index Name'] for n in index_scans}
+
+def _capture_queries(monkeypatch, module):
+    """Record the queries a model method sends instead of running them."""
+    captured = []
+
+    def fake_execute_query(query, params=None, **kwargs):
+        captured.append((query, params))
+        return []
+
+    monkeypatch.setattr(module, 'execute_query', fake_execute_query)
+    return captured
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_dashboard_queries_use_indexes(plan_cursor):
+    """Test the dashboard's review, task and activity queries."""
+    today = date.today()
+
+    assert_index_scan(plan_cursor, 'controls', """
+        SELECT COUNT(*) FROM controls
+        WHERE nextreviewdate BETWEEN %s AND %s
+    """, (today, today + timedelta(days=30)))
+
+    used = assert_index_scan(plan_cursor, 'tasks', """
+        SELECT t.taskid, t.controlid, t.taskdescription, t.duedate, t.status
+        FROM tasks t
+        WHERE t.assignedto = %s AND t.status != 'Completed'
+        ORDER BY t.duedate ASC NULLS LAST
+        LIMIT 10
+    """, ('planuser7',))
+    assert used & {'idx_tasks_open_assignedto', 'idx_tasks_assignedto_status'}
+
+    assert_index_scan(plan_cursor, 'auditlogs', """
+        SELECT * FROM auditlogs
+        WHERE objecttype IN ('control', 'task')
+        AND action IN ('created', 'updated', 'deleted', 'completed', 'confirmed')
+        ORDER BY logid DESC
+        LIMIT 10
+    """)
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_reports_queries_use_indexes(plan_cursor, monkeypatch):
+    """Test the per-user task counts, overdue tasks and review date queries."""
+    today = date.today()
+
+    assert_index_scan(
+        plan_cursor, 'tasks',
+        'SELECT COUNT(*) FROM tasks WHERE assignedto = %s AND status = %s',
+        ('planuser7', 'Open')
+    )
+
+    captured = _capture_queries(monkeypatch, task_module)
+    Task.get_overdue()
+    Task.get_for_review('planreviewer3')
+    for query, params in captured:
+        assert_index_scan(plan_cursor, 'tasks', query, params)
+
+    assert_index_scan(plan_cursor, 'controls', """
+        SELECT *, %s::date - nextreviewdate AS days_since FROM controls
+        WHERE nextreviewdate < %s
+        ORDER BY nextreviewdate
+        LIMIT 50
+    """, (today, today))
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_calendar_queries_use_indexes(plan_cursor):
+    """Test the calendar's paginated review date and due date listings."""
+    today = date.today()
+
+    assert_index_scan(plan_cursor, 'controls', """
+        SELECT controlid, controlname, nextreviewdate,
+               CASE WHEN nextreviewdate < %s THEN 'past-due'
+                    WHEN nextreviewdate <= %s THEN 'upcoming'
+                    ELSE '' END AS status
+        FROM controls
+        WHERE nextreviewdate IS NOT NULL
+        ORDER BY nextreviewdate
+        LIMIT %s OFFSET %s
+    """, (today, today + timedelta(days=30), 10, 0))
+
+    assert_index_scan(plan_cursor, 'tasks', """
+        SELECT * FROM tasks
+        ORDER BY duedate
+        LIMIT %s OFFSET %s
+    """, (10, 0))
+
+@pytest.mark.integration
+@pytest.mark.slow
+def test_audit_log_by_object_uses_index(plan_cursor, monkeypatch):
+    """Test AuditLog.get_by_object and get_by_user."""
+    captured = _capture_queries(monkeypatch, audit_module)
+    AuditLog.get_by_object('control', '123')
+    AuditLog.get_by_object('control', '123', limit=20)
+    AuditLog.get_by_user('planuser7', limit=20)
+
+    used = set()
+    for query, params in captured:
+        used |= assert_index_scan(plan_cursor, 'auditlogs', query, params)
+    assert {'idx_auditlogs_object', 'idx_auditlogs_username'} <= used
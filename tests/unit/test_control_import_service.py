@@ -0,0 +1,100 @@
+"""Unit tests for the control CSV import service."""
+
+import io
+import pytest
+from cmmc_tracker.app.services.control_import import (
+    import_controls_csv, parse_control_row, ControlImportError
+)
+from cmmc_tracker.app.services.database import execute_query
+
+HEADER = "Control ID,Control Name,Control Description,NIST Mapping,Review Frequency,Last Review Date,Next Review Date\n"
+
+def _csv(*lines):
+    """Build an in-memory CSV upload."""
+    return io.BytesIO((HEADER + "\n".join(lines) + "\n").encode('utf-8'))
+
+@pytest.fixture
+def import_tables(init_database):
+    """Start from a known control."""
+    execute_query("DELETE FROM controls WHERE controlid LIKE %s", ('TEST.IMP.%',), commit=True)
+    execute_query(
+        "INSERT INTO controls (controlid, controlname, controldescription, nist_sp_800_171_mapping, policyreviewfrequency) "
+        "VALUES (%s, %s, %s, %s, %s)",
+        ('TEST.IMP.001', 'Existing', 'Same', 'NIST', 'Annual'),
+        commit=True
+    )
+    return init_database
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_parse_control_row():
+    """Test row validation and normalization."""
+    values = parse_control_row({
+        'Control ID': ' AC.L2-3.1.1 ',
+        'Control Name': 'Authorized Access Control',
+        'Last Review Date': '2024-01-15',
+        'Next Review Date': ''
+    })
+    assert values == ('AC.L2-3.1.1', 'Authorized Access Control', '', '', '', '2024-01-15', None)
+
+    with pytest.raises(ValueError):
+        parse_control_row({'Control ID': 'AC.L2-3.1.1', 'Control Name': ''})
+
+    with pytest.raises(ValueError):
+        parse_control_row({'Control ID': 'AC.L2-3.1.1', 'Control Name': 'Name', 'Last Review Date': '01/15/2024'})
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_import_dry_run_writes_nothing(import_tables):
+    """Test that a dry run reports counts without changing the database."""
+    upload = _csv(
+        "TEST.IMP.001,Existing,Same,NIST,Annual,,",
+        "TEST.IMP.002,New Control,,,,2024-01-01,2025-01-01",
+        "TEST.IMP.003,,Missing name,,,,",
+        "TEST.IMP.002,Duplicate,,,,,",
+    )
+
+    report = import_controls_csv(upload, 'import_tester', dry_run=True, batch_size=2)
+
+    assert report['inserted'] == 1
+    assert report['updated'] == 0
+    assert report['unchanged'] == 1
+    assert report['errors'] == 2
+    assert len(report['error_messages']) == 2
+    assert execute_query(
+        "SELECT COUNT(*) FROM controls WHERE controlid = %s", ('TEST.IMP.002',), fetch_one=True
+    )[0] == 0
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_import_upserts_and_audits(import_tables):
+    """Test that an import inserts, updates and logs in bulk."""
+    upload = _csv(
+        "TEST.IMP.001,Existing Renamed,Same,NIST,Annual,,",
+        "TEST.IMP.002,New Control,,,,2024-01-01,2025-01-01",
+        "TEST.IMP.003,Another Control,,,,,",
+    )
+
+    report = import_controls_csv(upload, 'import_tester', batch_size=2)
+
+    assert (report['inserted'], report['updated'], report['unchanged'], report['errors']) == (2, 1, 0, 0)
+    assert execute_query(
+        "SELECT controlname FROM controls WHERE controlid = %s", ('TEST.IMP.001',), fetch_one=True
+    )['controlname'] == 'Existing Renamed'
+    assert execute_query(
+        "SELECT COUNT(*) FROM auditlogs WHERE username = %s AND action = %s",
+        ('import_tester', 'Import Control'),
+        fetch_one=True
+    )[0] == 3
+
+    # Re-importing the same file changes nothing
+    upload.seek(0)
+    report = import_controls_csv(upload, 'import_tester')
+    assert (report['inserted'], report['updated'], report['unchanged']) == (0, 0, 3)
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_import_requires_columns(import_tables):
+    """Test that files without the required columns are rejected."""
+    with pytest.raises(ControlImportError):
+        import_controls_csv(io.BytesIO(b"ID,Name\nX,Y\n"), 'import_tester')
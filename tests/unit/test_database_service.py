@@ -1,7 +1,11 @@
 """Unit tests for the database service."""
 
 import pytest
-from cmmc_tracker.app.services.database import execute_query, get_by_id, insert, update, delete
+from cmmc_tracker.app.services.database import (
+    execute_query, get_by_id, insert, update, delete,
+    convert_placeholders, StatementCache, get_db_connection, get_statement_cache,
+    insert_many, upsert_many, copy_rows, transaction, in_transaction, stream_query
+)
 
 @pytest.mark.unit
 @pytest.mark.services
@@ -81,3 +85,215 @@ def test_insert_update_delete(init_database):
     """Test the insert, update, and delete functions."""
     # This test requires a database connection and will be tested in integration tests
     pass
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_convert_placeholders():
+    """Test converting psycopg2 placeholders into PREPARE parameters."""
+    assert convert_placeholders("SELECT 1") == ("SELECT 1", 0)
+    assert convert_placeholders(
+        "SELECT * FROM tasks WHERE assignedto = %s AND status != %s"
+    ) == ("SELECT * FROM tasks WHERE assignedto = $1 AND status != $2", 2)
+    assert convert_placeholders(
+        "SELECT * FROM controls WHERE controlid LIKE 'AC%%' AND controlname = %s"
+    ) == ("SELECT * FROM controls WHERE controlid LIKE 'AC%' AND controlname = $1", 1)
+    # Named placeholders are not supported
+    assert convert_placeholders("SELECT * FROM users WHERE userid = %(id)s") == (None, 0)
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_statement_cache_lru():
+    """Test statement cache thresholds and LRU eviction."""
+    cache = StatementCache(max_size=2, threshold=2)
+
+    # Statements are only prepared once they've been seen threshold times
+    assert cache.should_prepare('a') is False
+    assert cache.should_prepare('a') is True
+    name_a = cache.add('a')
+    assert cache.get('a') == name_a
+
+    name_b = cache.add('b')
+    cache.get('a')  # 'a' is now the most recently used
+    cache.add('c')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == name_a
+    assert cache.pending_deallocations == [name_b]
+
+    # Statements the server refused to prepare are never retried
+    cache.mark_unpreparable('d')
+    assert cache.should_prepare('d') is False
+
+    cache.invalidate()
+    assert cache.get('a') is None
+    assert cache.reset_pending is True
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_execute_query_uses_prepared_statements(init_database):
+    """Test that repeated queries are served from the prepared statement cache."""
+    query = "SELECT controlname FROM controls WHERE controlid = %s"
+    execute_query(
+        "INSERT INTO controls (controlid, controlname) VALUES (%s, %s)",
+        ('TEST.DB.002', 'Prepared Statement Control'),
+        commit=True
+    )
+
+    for _ in range(3):
+        result = execute_query(query, ('TEST.DB.002',), fetch_one=True)
+        assert result['controlname'] == 'Prepared Statement Control'
+
+    cache = get_statement_cache(get_db_connection())
+    assert cache is not None
+    assert cache.get((query, True)) is not None
+
+    # Queries whose parameter types can't be inferred fall back to a plain execute
+    for _ in range(3):
+        result = execute_query("SELECT %s IS NULL AS missing", (None,), fetch_one=True)
+        assert result['missing'] is True
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_bulk_insert_and_upsert(init_database):
+    """Test the insert_many and upsert_many functions."""
+    columns = ['controlid', 'controlname', 'controldescription']
+
+    inserted = insert_many(
+        'controls',
+        columns,
+        [(f'TEST.BULK.{i:03d}', f'Bulk Control {i}', None) for i in range(25)],
+        page_size=10
+    )
+    assert inserted == 25
+
+    # Existing rows are updated, new ones inserted; duplicate keys keep the last row
+    results = upsert_many(
+        'controls',
+        columns,
+        [
+            {'controlid': 'TEST.BULK.000', 'controlname': 'Renamed', 'controldescription': 'first'},
+            {'controlid': 'TEST.BULK.000', 'controlname': 'Renamed Again', 'controldescription': 'second'},
+            {'controlid': 'TEST.BULK.100', 'controlname': 'New Bulk Control', 'controldescription': None},
+        ],
+        conflict_columns=['controlid'],
+        returning='controlid, (xmax = 0) AS inserted'
+    )
+    assert {row['controlid']: row['inserted'] for row in results} == {
+        'TEST.BULK.000': False,
+        'TEST.BULK.100': True,
+    }
+
+    result = execute_query(
+        "SELECT controlname, controldescription FROM controls WHERE controlid = %s",
+        ('TEST.BULK.000',),
+        fetch_one=True
+    )
+    assert result['controlname'] == 'Renamed Again'
+    assert result['controldescription'] == 'second'
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_copy_rows(init_database):
+    """Test loading rows with COPY, including NULLs and special characters."""
+    copied = copy_rows(
+        'controls',
+        ['controlid', 'controlname', 'controldescription'],
+        [
+            ('TEST.COPY.001', 'Tab\tand newline\ncontrol', None),
+            ('TEST.COPY.002', 'Back\\slash', ''),
+            ('TEST.COPY.003', 'Plain', 'Description'),
+        ],
+        page_size=2
+    )
+    assert copied == 3
+
+    rows = execute_query(
+        "SELECT controlid, controlname, controldescription FROM controls WHERE controlid LIKE %s ORDER BY controlid",
+        ('TEST.COPY.%',),
+        fetch_all=True
+    )
+    assert [row['controlname'] for row in rows] == ['Tab\tand newline\ncontrol', 'Back\\slash', 'Plain']
+    assert rows[0]['controldescription'] is None
+    assert rows[1]['controldescription'] == ''
+
+def _control_exists(control_id):
+    """Check for a control from a separate connection, so only committed rows count."""
+    import psycopg2
+    from flask import current_app
+    conn = psycopg2.connect(
+        host=current_app.config['DB_HOST'],
+        port=current_app.config['DB_PORT'],
+        dbname=current_app.config['DB_NAME'],
+        user=current_app.config['DB_USER'],
+        password=current_app.config['DB_PASSWORD']
+    )
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM controls WHERE controlid = %s", (control_id,))
+            return cursor.fetchone() is not None
+    finally:
+        conn.close()
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_transaction_commits_once(init_database):
+    """Test that writes inside transaction() are committed together on exit."""
+    with transaction() as tx:
+        assert in_transaction()
+        insert('controls', {'controlid': 'TEST.TX.001', 'controlname': 'Transaction Control'})
+        with transaction():
+            execute_query(
+                "INSERT INTO controls (controlid, controlname) VALUES (%s, %s)",
+                ('TEST.TX.002', 'Nested Transaction Control'),
+                commit=True
+            )
+        # Nothing is visible to other connections until the outer block exits
+        assert not _control_exists('TEST.TX.001')
+        assert not _control_exists('TEST.TX.002')
+
+    assert not in_transaction()
+    assert tx.committed
+    assert _control_exists('TEST.TX.001')
+    assert _control_exists('TEST.TX.002')
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_transaction_rolls_back(init_database):
+    """Test that an exception or a failed statement rolls the whole block back."""
+    with pytest.raises(ValueError):
+        with transaction():
+            insert('controls', {'controlid': 'TEST.TX.003', 'controlname': 'Rolled Back'})
+            raise ValueError('boom')
+    assert not _control_exists('TEST.TX.003')
+
+    # A failed statement whose error is swallowed still makes the block roll back
+    with transaction() as tx:
+        insert('controls', {'controlid': 'TEST.TX.004', 'controlname': 'Rolled Back'})
+        try:
+            insert('controls', {'controlid': 'TEST.TX.004', 'controlname': 'Duplicate'})
+        except Exception:
+            pass
+        insert('controls', {'controlid': 'TEST.TX.005', 'controlname': 'After Failure'})
+
+    assert tx.rollback_only
+    assert not tx.committed
+    assert not _control_exists('TEST.TX.004')
+    assert not _control_exists('TEST.TX.005')
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_stream_query(init_database):
+    """Test iterating a query through a server-side cursor."""
+    rows = stream_query(
+        "SELECT n, n * 2 AS doubled FROM generate_series(1, %s) AS n ORDER BY n",
+        (25,),
+        itersize=10
+    )
+    results = [(row['n'], row['doubled']) for row in rows]
+    assert results == [(n, n * 2) for n in range(1, 26)]
+
+    # Closing the generator early releases the cursor
+    rows = stream_query("SELECT n FROM generate_series(1, 100) AS n", itersize=10)
+    assert next(rows)['n'] == 1
+    rows.close()
+    assert execute_query("SELECT 1 AS test", fetch_one=True)['test'] == 1
@@ -28,6 +28,13 @@ def test_parse_date():
     # Test with invalid date string
     assert parse_date("not-a-date") is None
 
+    # Date objects from DATE columns pass through untouched
+    d = date(2023, 1, 15)
+    assert parse_date(d) is d
+
+    # Datetimes are reduced to their date
+    assert parse_date(datetime(2023, 1, 15, 12, 30)) == date(2023, 1, 15)
+
 @pytest.mark.unit
 @pytest.mark.utils
 def test_format_date():
@@ -0,0 +1,37 @@
+"""Unit tests for the export service."""
+
+import csv
+import io
+import pytest
+from cmmc_tracker.app.services.export import generate_csv
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_generate_csv_chunks():
+    """Test that CSV output is produced in chunks and parses back to the input."""
+    header = ['ID', 'Name']
+    rows = ([i, f'Name, {i}'] for i in range(10))
+
+    chunks = list(generate_csv(header, rows, chunk_rows=4))
+
+    assert len(chunks) == 3
+    parsed = list(csv.reader(io.StringIO(''.join(chunks))))
+    assert parsed[0] == header
+    assert parsed[1:] == [[str(i), f'Name, {i}'] for i in range(10)]
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_generate_csv_header_only():
+    """Test that an empty export still contains the header."""
+    chunks = list(generate_csv(['ID'], iter([])))
+    assert chunks == ['ID\r\n']
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_generate_csv_stops_on_error():
+    """Test that a failing row source ends the file instead of raising mid-stream."""
+    def rows():
+        yield [1]
+        raise Exception('Database operation failed')
+
+    assert ''.join(generate_csv(['ID'], rows())) == 'ID\r\n1\r\n'
@@ -0,0 +1,99 @@
+"""Unit tests for the control search service."""
+
+import os
+import pytest
+from cmmc_tracker.app.models.control import Control
+from cmmc_tracker.app.services.database import execute_query, escape_like
+from cmmc_tracker.app.services.search import search_controls, count_controls
+
+MIGRATION = os.path.join(os.path.dirname(__file__), '..', '..', 'db', '11_control_search.sql')
+
+CONTROLS = [
+    ('SRCH.AC-3.1.1', 'Limit system access', 'Limit information system access to authorized users.'),
+    ('SRCH.AC-3.1.2', 'Limit transaction types', 'Limit access to the types of transactions users may run.'),
+    ('SRCH.AU-3.3.1', 'Create audit records', 'Create and retain system audit logs and records.'),
+    ('SRCH.IA-3.5.3', 'Multifactor authentication', 'Use multifactor authentication for privileged accounts.'),
+    ('SRCH.MP_100%', 'Media protection', 'Protect system media containing CUI.'),
+]
+
+@pytest.fixture
+def search_controls_table(init_database):
+    """Apply the search migration and load a known set of controls."""
+    with open(MIGRATION) as f:
+        execute_query(f.read(), commit=True)
+    execute_query("DELETE FROM controls WHERE controlid LIKE %s", ('SRCH.%',), commit=True)
+    for control in CONTROLS:
+        execute_query(
+            "INSERT INTO controls (controlid, controlname, controldescription) VALUES (%s, %s, %s)",
+            control,
+            commit=True
+        )
+    yield init_database
+    execute_query("DELETE FROM controls WHERE controlid LIKE %s", ('SRCH.%',), commit=True)
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_escape_like():
+    """Test escaping LIKE wildcards."""
+    assert escape_like('AC.1') == 'AC.1'
+    assert escape_like('100%_done') == '100\\%\\_done'
+    assert escape_like('a\\b') == 'a\\\\b'
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_search_full_text_ranked(search_controls_table):
+    """Test full-text matches are stemmed, case-insensitive and ranked."""
+    rows, total = search_controls('AUDIT Record', limit=10)
+    assert total == 1
+    assert [row['controlid'] for row in rows] == ['SRCH.AU-3.3.1']
+
+    # Name matches outrank description-only matches
+    rows, total = search_controls('limit access', limit=10)
+    assert total == 2
+    assert rows[0]['controlid'] == 'SRCH.AC-3.1.1'
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_search_by_control_id(search_controls_table):
+    """Test ID prefix matches come first and ignore case."""
+    rows, total = search_controls('srch.ac-3.1', limit=10)
+    assert total == 2
+    assert [row['controlid'] for row in rows] == ['SRCH.AC-3.1.1', 'SRCH.AC-3.1.2']
+
+    # An exact ID sorts ahead of other matches
+    rows, _ = search_controls('SRCH.AC-3.1.2', limit=10)
+    assert rows[0]['controlid'] == 'SRCH.AC-3.1.2'
+
+    # Wildcards in the term are matched literally
+    rows, total = search_controls('MP_100%', limit=10)
+    assert total == 1
+    assert rows[0]['controlid'] == 'SRCH.MP_100%'
+    assert count_controls('MP_1') == 1
+    assert count_controls('MPX1') == 0
+
+@pytest.mark.unit
+@pytest.mark.services
+def test_search_paging_and_sorting(search_controls_table):
+    """Test the total count is returned with each page."""
+    rows, total = search_controls('SRCH', limit=2, offset=0, sort_by='controlid')
+    assert total == 5
+    assert [row['controlid'] for row in rows] == ['SRCH.AC-3.1.1', 'SRCH.AC-3.1.2']
+
+    rows, total = search_controls('SRCH', limit=2, offset=4, sort_by='controlid', sort_order='desc')
+    assert total == 5
+    assert [row['controlid'] for row in rows] == ['SRCH.AC-3.1.1']
+
+    # Past the last page the count still comes back
+    rows, total = search_controls('SRCH', limit=2, offset=10)
+    assert rows == []
+    assert total == 5
+
+    assert search_controls('   ') == ([], 0)
+
+@pytest.mark.unit
+@pytest.mark.models
+def test_control_search_and_count(search_controls_table):
+    """Test Control.search and Control.count use the search service."""
+    controls = Control.search('multifactor')
+    assert [control.control_id for control in controls] == ['SRCH.IA-3.5.3']
+    assert Control.count('multifactor') == 1